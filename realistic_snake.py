@@ -10,12 +10,18 @@ import math
 import sys
 import time
 import noise
+import numpy as np
 
 pygame.init()
 
 # Constants
 W, H = 1000, 800
 TERRAIN_SCALE = 0.02
+TERRAIN_MIN, TERRAIN_MAX, TILE_SIZE = -100, 200, 10
+WANDER_INTERVAL = (30, 120)  # Game-time units, 60 per second
+PHYSICS_STEP = 1 / 60  # Fixed simulation step in seconds (one game-time unit)
+RENDER_FPS = 60
+PREY_CELL = 150  # Spatial hash cell; >= fear radius so 3x3 cells cover it
 
 # Ultra-realistic colors
 GRASS_BASE = (34, 59, 22)
@@ -24,61 +30,118 @@ WATER = (28, 107, 160)
 SNAKE_COLORS = [(15, 40, 15), (25, 60, 25), (40, 80, 40), (60, 100, 60)]
 PREY_COLORS = [(139, 69, 19), (160, 82, 45), (205, 133, 63)]
 
-class TerrainTile:
-    def __init__(self, x, y):
-        self.x, self.y = x, y
-        self.height = noise.pnoise2(x * TERRAIN_SCALE, y * TERRAIN_SCALE) * 100
-        self.moisture = noise.pnoise2(x * TERRAIN_SCALE * 0.5, y * TERRAIN_SCALE * 0.5) * 50 + 50
-        self.vegetation = max(0, self.moisture - abs(self.height) * 0.3)
-        self.color = self.calculate_color()
-        
-    def calculate_color(self):
-        if self.height < -20: return WATER
-        elif self.vegetation > 40: 
-            green_intensity = min(255, int(50 + self.vegetation * 2))
-            return (10, green_intensity, 20)
-        else: 
-            return (int(DIRT[0] + self.height * 0.2), int(DIRT[1] + self.height * 0.1), DIRT[2])
+# Breathing sine lookup: index with int(phase * _SIN_LUT_SCALE) & 1023
+_SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, 1024, endpoint=False)).astype(np.float32)
+_SIN_LUT_SCALE = 1024 / (2 * math.pi)
+
+# Fixed head-scale directions and the +/-0.3 rad eye spread
+_HEAD_SCALE_DIRS = tuple((math.cos(i), math.sin(i)) for i in range(6))
+_EYE_COS, _EYE_SIN = math.cos(0.3), math.sin(0.3)
+
+# Shared scale-texture jitter, indexed by (color index * 8 + layer) & 63
+_SCALE_LUT = tuple(random.random() for _ in range(64))
+
+def generate_terrain():
+    """Evaluate height/moisture/vegetation for the whole world grid in one pass.
+    
+    Arrays are indexed [x, y] to match pygame.surfarray.
+    """
+    coords = np.arange(TERRAIN_MIN, TERRAIN_MAX + 1, TILE_SIZE, dtype=np.float64)
+    xs, ys = np.meshgrid(coords, coords, indexing='ij')
+    pnoise2 = np.frompyfunc(noise.pnoise2, 2, 1)  # noise has no array API
+    
+    height = pnoise2(xs * TERRAIN_SCALE, ys * TERRAIN_SCALE).astype(np.float32) * 100
+    moisture = pnoise2(xs * TERRAIN_SCALE * 0.5, ys * TERRAIN_SCALE * 0.5).astype(np.float32) * 50 + 50
+    vegetation = np.maximum(0, moisture - np.abs(height) * 0.3)
+    
+    green_intensity = np.minimum(255, (50 + vegetation * 2).astype(np.int32))
+    green = np.stack([np.full_like(green_intensity, 10), green_intensity, 
+                      np.full_like(green_intensity, 20)], axis=-1)
+    dirt = np.stack([(DIRT[0] + height * 0.2).astype(np.int32), 
+                     (DIRT[1] + height * 0.1).astype(np.int32), 
+                     np.full(height.shape, DIRT[2], dtype=np.int32)], axis=-1)
+    
+    colors = np.where((vegetation > 40)[..., None], green, dirt)
+    colors = np.where((height < -20)[..., None], np.array(WATER, dtype=np.int32), colors)
+    return colors.astype(np.uint8), vegetation
+
+# Pre-rendered segment bodies keyed by (radius, color index, is head). The
+# breathing phase only changes the radius, so this stays bounded.
+SEGMENT_CACHE = {}
+
+def build_segment_sprite(radius, color_index, head=False):
+    """Render the layered segment body once onto a per-pixel alpha surface.
+    
+    Needs the display to exist: the sprite is converted to its pixel format.
+    """
+    size = 2 * radius + 3
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    # Soft drop shadow; alpha is only honoured because the sprite is SRCALPHA
+    pygame.draw.circle(sprite, (0, 0, 0, 30), (radius + 2, radius + 2), radius)
+    
+    # Multi-layer rendering for realism
+    for layer in range(radius // 2):
+        layer_width = radius - layer * 2
+        
+        # Scale coloration
+        base_color = SNAKE_COLORS[(color_index + layer) % len(SNAKE_COLORS)]
+        
+        # Add scale texture
+        scale_offset = int(_SCALE_LUT[(color_index * 8 + layer) & 63] * 30)
+        color = (min(255, base_color[0] + scale_offset), 
+                min(255, base_color[1] + scale_offset), 
+                min(255, base_color[2] + scale_offset // 2))
+        
+        # Main body
+        pygame.draw.circle(sprite, color, (radius, radius), layer_width)
+        
+    # Detailed scales for head
+    if head:
+        for cos_i, sin_i in _HEAD_SCALE_DIRS:
+            scale_x = radius + cos_i * radius * 0.3
+            scale_y = radius + sin_i * radius * 0.3
+            pygame.draw.circle(sprite, (5, 20, 5), (int(scale_x), int(scale_y)), 2)
+    return sprite.convert_alpha()
+
+def build_prey_sprites():
+    """One body + highlight sprite per (color index, size) prey variant"""
+    sprites = {}
+    for color_index, color in enumerate(PREY_COLORS):
+        highlight = (min(255, color[0] + 40), min(255, color[1] + 40), min(255, color[2] + 40))
+        for size in range(8, 16):
+            sprite = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            pygame.draw.circle(sprite, highlight, (size - 2, size - 2), size // 2)
+            sprites[(color_index, size)] = sprite.convert_alpha()
+    return sprites
 
 class SnakeSegment:
-    def __init__(self, x, y, prev=None, index=0):
-        self.x, self.y = float(x), float(y)
-        self.old_x, self.old_y = x, y
-        self.prev = prev
+    """Thin view onto one index of the ecosystem's snake arrays"""
+    def __init__(self, body, index=0):
+        self.body = body
         self.index = index
-        self.angle = 0
-        self.target_angle = 0
-        self.width = max(3, 25 - index * 1.2)
-        self.breathing = random.random() * 6.28
-        self.muscle_tension = 0
-        self.scale_pattern = [random.random() for _ in range(8)]
-        
-    def update(self, dt):
-        self.old_x, self.old_y = self.x, self.y
-        
-        if self.prev:
-            # Advanced following with spring physics
-            target_dist = self.width * 0.8
-            dx = self.prev.x - self.x
-            dy = self.prev.y - self.y
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist > 0:
-                # Spring force
-                force = (dist - target_dist) * 0.15
-                self.x += (dx / dist) * force * dt
-                self.y += (dy / dist) * force * dt
-                
-                # Update angle for realistic bending
-                self.target_angle = math.atan2(dy, dx)
-                angle_diff = self.target_angle - self.angle
-                while angle_diff > math.pi: angle_diff -= 2 * math.pi
-                while angle_diff < -math.pi: angle_diff += 2 * math.pi
-                self.angle += angle_diff * 0.1
         
-        # Breathing animation
-        self.breathing += 2 * dt
-        self.muscle_tension = 0.5 + 0.3 * math.sin(self.breathing)
+    @property
+    def x(self): return self.body.sx[self.index]
+    @x.setter
+    def x(self, value): self.body.sx[self.index] = value
+    
+    @property
+    def y(self): return self.body.sy[self.index]
+    @y.setter
+    def y(self, value): self.body.sy[self.index] = value
+    
+    @property
+    def angle(self): return self.body.sangle[self.index]
+    @angle.setter
+    def angle(self, value): self.body.sangle[self.index] = value
+    
+    @property
+    def width(self): return self.body.swidth[self.index]
+    
+    @property
+    def muscle_tension(self): return self.body.stension[self.index]
         
     def draw(self, screen, camera_x, camera_y):
         screen_x = self.x - camera_x
@@ -87,117 +150,173 @@ class SnakeSegment:
         if -50 < screen_x < W + 50 and -50 < screen_y < H + 50:
             # Dynamic width with breathing
             current_width = self.width * self.muscle_tension
+            radius = int(current_width)
             
-            # Multi-layer rendering for realism
-            for layer in range(int(current_width // 2)):
-                alpha = 255 - layer * 15
-                layer_width = current_width - layer * 2
-                
-                # Scale coloration
-                color_index = (self.index + layer) % len(SNAKE_COLORS)
-                base_color = SNAKE_COLORS[color_index]
-                
-                # Add scale texture
-                scale_offset = int(self.scale_pattern[layer % 8] * 30)
-                color = (min(255, base_color[0] + scale_offset), 
-                        min(255, base_color[1] + scale_offset), 
-                        min(255, base_color[2] + scale_offset // 2))
-                
-                # Shadow
-                pygame.draw.circle(screen, (0, 0, 0, 30), 
-                                 (int(screen_x + 2), int(screen_y + 2)), int(layer_width))
-                
-                # Main body
-                pygame.draw.circle(screen, color, 
-                                 (int(screen_x), int(screen_y)), int(layer_width))
+            # Multi-layer body comes from the sprite cache, one blit per segment
+            key = (radius, self.index % len(SNAKE_COLORS), self.index == 0)
+            sprite = SEGMENT_CACHE.get(key)
+            if sprite is None:
+                sprite = SEGMENT_CACHE[key] = build_segment_sprite(radius, key[1], key[2])
+            screen.blit(sprite, (int(screen_x) - radius, int(screen_y) - radius))
             
-            # Detailed scales for head
             if self.index == 0:
-                for i in range(6):
-                    scale_x = screen_x + math.cos(i) * current_width * 0.3
-                    scale_y = screen_y + math.sin(i) * current_width * 0.3
-                    pygame.draw.circle(screen, (5, 20, 5), (int(scale_x), int(scale_y)), 2)
-                
                 # Eyes
                 eye_offset = current_width * 0.6
-                eye1_x = screen_x + math.cos(self.angle + 0.3) * eye_offset
-                eye1_y = screen_y + math.sin(self.angle + 0.3) * eye_offset
-                eye2_x = screen_x + math.cos(self.angle - 0.3) * eye_offset
-                eye2_y = screen_y + math.sin(self.angle - 0.3) * eye_offset
+                cos_a, sin_a = math.cos(self.angle), math.sin(self.angle)
+                # cos/sin(angle -/+ 0.3) by the angle-sum identities
+                along = cos_a * _EYE_COS * eye_offset, sin_a * _EYE_COS * eye_offset
+                across = sin_a * _EYE_SIN * eye_offset, cos_a * _EYE_SIN * eye_offset
+                eye1_x = screen_x + along[0] - across[0]
+                eye1_y = screen_y + along[1] + across[1]
+                eye2_x = screen_x + along[0] + across[0]
+                eye2_y = screen_y + along[1] - across[1]
                 
                 pygame.draw.circle(screen, (255, 255, 0), (int(eye1_x), int(eye1_y)), 3)
                 pygame.draw.circle(screen, (255, 255, 0), (int(eye2_x), int(eye2_y)), 3)
                 pygame.draw.circle(screen, (0, 0, 0), (int(eye1_x), int(eye1_y)), 1)
                 pygame.draw.circle(screen, (0, 0, 0), (int(eye2_x), int(eye2_y)), 1)
 
-class Prey:
-    def __init__(self, x, y):
-        self.x, self.y = float(x), float(y)
-        self.vx = self.vy = 0
-        self.fear_level = 0
-        self.size = random.randint(8, 15)
-        self.color = random.choice(PREY_COLORS)
-        self.alive = True
-        self.last_move = time.time()
-        self.energy = 100
-        
-    def update(self, snake_head, dt):
-        if not self.alive: return
-        
-        # Fear response to snake
-        dist_to_snake = math.sqrt((self.x - snake_head.x)**2 + (self.y - snake_head.y)**2)
-        if dist_to_snake < 150:
-            self.fear_level = min(100, 100 - dist_to_snake)
-            # Flee from snake
-            flee_x = (self.x - snake_head.x) / dist_to_snake
-            flee_y = (self.y - snake_head.y) / dist_to_snake
-            self.vx += flee_x * self.fear_level * 0.01
-            self.vy += flee_y * self.fear_level * 0.01
-        else:
-            self.fear_level *= 0.95
+class PreyPool:
+    """Struct-of-arrays prey flock, updated with whole-array NumPy ops"""
+    def __init__(self, capacity=20):
+        self.px = np.zeros(capacity, dtype=np.float32)
+        self.py = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.fear = np.zeros(capacity, dtype=np.float32)
+        self.energy = np.zeros(capacity, dtype=np.float32)
+        self.last_move = np.zeros(capacity, dtype=np.float64)
+        self.move_interval = np.zeros(capacity, dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)  # Index into PREY_COLORS
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.frozen = np.zeros(capacity, dtype=bool)
+        self.sprites = build_prey_sprites()
+        self.rebuild_grid()
+        
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+        
+    def rebuild_grid(self):
+        # Spatial hash as live prey indices sorted by packed (cell x, cell y) key
+        alive = np.flatnonzero(self.alive)
+        cell_x = np.floor_divide(self.px[alive], PREY_CELL).astype(np.int64)
+        cell_y = np.floor_divide(self.py[alive], PREY_CELL).astype(np.int64)
+        keys = (cell_x << 32) + cell_y
+        order = np.argsort(keys)
+        self._grid_keys = keys[order]
+        self._grid_index = alive[order]
+        
+    def near(self, x, y):
+        """Indices of prey hashed into the 3x3 cells around (x, y)"""
+        cell_x, cell_y = int(x // PREY_CELL), int(y // PREY_CELL)
+        # For each column the three rows are consecutive keys: one range apiece
+        columns = (np.arange(cell_x - 1, cell_x + 2, dtype=np.int64) << 32) + cell_y
+        lo = np.searchsorted(self._grid_keys, columns - 1, 'left')
+        hi = np.searchsorted(self._grid_keys, columns + 1, 'right')
+        return np.concatenate([self._grid_index[a:b] for a, b in zip(lo, hi)])
+        
+    def _grow(self):
+        for name in ('px', 'py', 'vx', 'vy', 'fear', 'energy', 'last_move', 'move_interval', 
+                     'size', 'color', 'alive', 'frozen'):
+            arr = getattr(self, name)
+            setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
             
+    def spawn(self, x, y, game_time):
+        free = np.flatnonzero(~self.alive)
+        if not free.size:
+            self._grow()
+            free = np.flatnonzero(~self.alive)
+        i = free[0]
+        self.px[i], self.py[i] = x, y
+        self.vx[i] = self.vy[i] = 0
+        self.fear[i] = 0
+        self.size[i] = random.randint(8, 15)
+        self.color[i] = random.randrange(len(PREY_COLORS))
+        self.alive[i] = True
+        self.frozen[i] = False
+        self.last_move[i] = game_time
+        self.move_interval[i] = random.uniform(*WANDER_INTERVAL)
+        self.energy[i] = 100
+        
+    def update(self, snake_head, dt, game_time, view):
+        # Calm prey outside the padded view stay frozen until the camera nears
+        left, top, right, bottom = view
+        in_view = (self.px > left) & (self.px < right) & (self.py > top) & (self.py < bottom)
+        active = self.alive & (in_view | (self.fear >= 1))
+        # Restart the wander timer on thaw so prey don't spurt back in
+        self.last_move[active & self.frozen] = game_time
+        self.frozen = self.alive & ~active
+        
+        self.rebuild_grid()
+        idx = np.flatnonzero(active)
+        if not idx.size:
+            return
+        px, py, vx, vy = self.px[idx], self.py[idx], self.vx[idx], self.vy[idx]
+        
+        # Fear response to snake, tested only for prey in cells near the head
+        nearby = np.zeros(self.alive.size, dtype=bool)
+        nearby[self.near(snake_head.x, snake_head.y)] = True
+        candidates = np.flatnonzero(nearby[idx])
+        dx = px[candidates] - snake_head.x
+        dy = py[candidates] - snake_head.y
+        dist_sq = dx * dx + dy * dy
+        hit = dist_sq < 150 * 150
+        close = candidates[hit]
+        fear = self.fear[idx] * 0.95
+        if close.size:
+            dist = np.sqrt(dist_sq[hit])
+            fear[close] = np.minimum(100, 100 - dist)
+            # Flee from snake
+            push = fear[close] * 0.01 / np.where(dist > 0, dist, 1)
+            vx[close] += dx[hit] * push
+            vy[close] += dy[hit] * push
+        
         # Random wandering when calm
-        if self.fear_level < 20 and time.time() - self.last_move > random.uniform(0.5, 2.0):
-            self.vx += random.uniform(-0.5, 0.5)
-            self.vy += random.uniform(-0.5, 0.5)
-            self.last_move = time.time()
+        wander = (fear < 20) & (game_time - self.last_move[idx] > self.move_interval[idx])
+        count = int(np.count_nonzero(wander))
+        if count:
+            vx[wander] += np.random.uniform(-0.5, 0.5, count)
+            vy[wander] += np.random.uniform(-0.5, 0.5, count)
+            self.last_move[idx[wander]] = game_time
+            self.move_interval[idx[wander]] = np.random.uniform(*WANDER_INTERVAL, count)
             
         # Apply movement with friction
-        self.vx *= 0.9
-        self.vy *= 0.9
-        max_speed = 2 + self.fear_level * 0.05
-        speed = math.sqrt(self.vx**2 + self.vy**2)
-        if speed > max_speed:
-            self.vx = (self.vx / speed) * max_speed
-            self.vy = (self.vy / speed) * max_speed
-            
-        self.x += self.vx * dt
-        self.y += self.vy * dt
+        vx *= 0.9
+        vy *= 0.9
+        max_speed = 2 + fear * 0.05
+        fast = vx * vx + vy * vy > max_speed * max_speed
+        if fast.any():
+            scale = max_speed[fast] / np.sqrt(vx[fast] ** 2 + vy[fast] ** 2)
+            vx[fast] *= scale
+            vy[fast] *= scale
+        
+        self.px[idx] = px + vx * dt
+        self.py[idx] = py + vy * dt
+        self.vx[idx], self.vy[idx], self.fear[idx] = vx, vy, fear
         
         # Energy depletion
-        self.energy -= dt * (1 + self.fear_level * 0.1)
-        if self.energy <= 0:
-            self.alive = False
-            
-    def draw(self, screen, camera_x, camera_y):
-        if not self.alive: return
-        
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
+        self.energy[idx] -= dt * (1 + fear * 0.1)
+        self.alive[idx] = self.energy[idx] > 0
         
-        if -20 < screen_x < W + 20 and -20 < screen_y < H + 20:
-            # Fear indicator
-            if self.fear_level > 10:
-                fear_color = (int(255 * self.fear_level / 100), 0, 0)
-                pygame.draw.circle(screen, fear_color, 
-                                 (int(screen_x), int(screen_y)), self.size + 3, 2)
+    def draw(self, screen, camera_x, camera_y):
+        blit_list = []
+        for i in np.flatnonzero(self.alive):
+            screen_x = int(self.px[i] - camera_x)
+            screen_y = int(self.py[i] - camera_y)
             
-            # Body
-            pygame.draw.circle(screen, self.color, (int(screen_x), int(screen_y)), self.size)
-            pygame.draw.circle(screen, (min(255, self.color[0] + 40), 
-                                      min(255, self.color[1] + 40), 
-                                      min(255, self.color[2] + 40)), 
-                             (int(screen_x - 2), int(screen_y - 2)), self.size // 2)
+            if -20 < screen_x < W + 20 and -20 < screen_y < H + 20:
+                size = int(self.size[i])
+                
+                # Fear indicator
+                if self.fear[i] > 10:
+                    fear_color = (int(255 * self.fear[i] / 100), 0, 0)
+                    pygame.draw.circle(screen, fear_color, (screen_x, screen_y), size + 3, 2)
+                
+                # Body
+                blit_list.append((self.sprites[(int(self.color[i]), size)], 
+                                  (screen_x - size, screen_y - size)))
+        screen.blits(blit_list, doreturn=False)
 
 class RealisticEcosystem:
     def __init__(self):
@@ -207,21 +326,22 @@ class RealisticEcosystem:
         self.font = pygame.font.Font(None, 24)
         
         # Generate terrain
-        self.terrain = {}
-        for x in range(-100, 201, 10):
-            for y in range(-100, 201, 10):
-                self.terrain[(x, y)] = TerrainTile(x, y)
+        self.terrain_surface = self.render_terrain()
         
         self.reset()
         
     def reset(self):
         # Create realistic snake
         start_x, start_y = 0, 0
-        self.snake = []
-        for i in range(15):
-            segment = SnakeSegment(start_x - i * 5, start_y, 
-                                 self.snake[-1] if self.snake else None, i)
-            self.snake.append(segment)
+        count = 15
+        self.sx = start_x - np.arange(count, dtype=np.float64) * 5
+        self.sy = np.full(count, start_y, dtype=np.float64)
+        self.sangle = np.zeros(count)
+        self.swidth = np.maximum(3, 25 - np.arange(count) * 1.2)
+        self.sbreath = np.random.random(count) * 6.28
+        self.stension = np.zeros(count)
+        self.snake = [SnakeSegment(self, i) for i in range(count)]
+        self._draw_order = self.snake[::-1]  # Tail first so the head ends on top
             
         self.head = self.snake[0]
         self.direction = 0  # Radians
@@ -230,21 +350,21 @@ class RealisticEcosystem:
         self.hunger = 0
         self.energy = 100
         
-        # Ecosystem
-        self.prey = []
-        for _ in range(20):
-            self.spawn_prey()
-            
         self.camera_x = self.camera_y = 0
         self.time = 0
         self.score = 0
         
+        # Ecosystem
+        self.prey = PreyPool(20)
+        for _ in range(20):
+            self.spawn_prey()
+        
     def spawn_prey(self):
         angle = random.random() * 6.28
         distance = random.uniform(100, 300)
         x = self.head.x + math.cos(angle) * distance
         y = self.head.y + math.sin(angle) * distance
-        self.prey.append(Prey(x, y))
+        self.prey.spawn(x, y, self.time)
         
     def handle_input(self):
         keys = pygame.key.get_pressed()
@@ -270,8 +390,7 @@ class RealisticEcosystem:
         else:
             self.speed *= 0.95
             
-    def update(self):
-        dt = self.clock.get_time() / 16.67  # Normalize to 60fps
+    def update(self, dt=1.0):
         self.time += dt
         
         # Update snake head
@@ -280,27 +399,27 @@ class RealisticEcosystem:
         self.head.angle = self.direction
         
         # Update all segments
-        for segment in self.snake:
-            segment.update(dt)
+        self.update_segments(dt)
             
         # Update prey
-        for prey in self.prey[:]:
-            prey.update(self.head, dt)
-            if not prey.alive:
-                self.prey.remove(prey)
-                
+        view = (self.camera_x - 200, self.camera_y - 200, 
+                self.camera_x + W + 200, self.camera_y + H + 200)
+        self.prey.update(self.head, dt, self.time, view)
+            
         # Hunting mechanics
-        for prey in self.prey[:]:
-            if prey.alive:
-                dist = math.sqrt((self.head.x - prey.x)**2 + (self.head.y - prey.y)**2)
-                if dist < self.head.width:
-                    prey.alive = False
-                    self.prey.remove(prey)
-                    self.grow()
-                    self.score += 10
-                    self.energy = min(100, self.energy + 30)
-                    self.hunger = max(0, self.hunger - 20)
-                    
+        prey = self.prey
+        nearby = prey.near(self.head.x, self.head.y)
+        dist_sq = (self.head.x - prey.px[nearby]) ** 2 + (self.head.y - prey.py[nearby]) ** 2
+        caught = nearby[prey.alive[nearby] & (dist_sq < self.head.width ** 2)]
+        meals = caught.size
+        if meals:
+            prey.alive[caught] = False
+            for _ in range(meals):
+                self.grow()
+            self.score += 10 * meals
+            self.energy = min(100, self.energy + 30 * meals)
+            self.hunger = max(0, self.hunger - 20 * meals)
+                
         # Spawn new prey
         if len(self.prey) < 15:
             self.spawn_prey()
@@ -315,34 +434,61 @@ class RealisticEcosystem:
         self.camera_x += (self.head.x - W//2 - self.camera_x) * 0.05
         self.camera_y += (self.head.y - H//2 - self.camera_y) * 0.05
         
+    def update_segments(self, dt):
+        # Advanced following with spring physics, every link in one pass
+        sx, sy = self.sx, self.sy
+        dx = sx[:-1] - sx[1:]
+        dy = sy[:-1] - sy[1:]
+        dist = np.hypot(dx, dy)
+        moving = dist > 0
+        safe_dist = np.where(moving, dist, 1)
+        
+        # Spring force
+        force = (dist - self.swidth[1:] * 0.8) * 0.15 * dt
+        sx[1:] += np.where(moving, dx / safe_dist * force, 0)
+        sy[1:] += np.where(moving, dy / safe_dist * force, 0)
+        
+        # Update angle for realistic bending, wrapped to [-pi, pi)
+        angle_diff = np.mod(np.arctan2(dy, dx) - self.sangle[1:] + np.pi, 2 * np.pi) - np.pi
+        self.sangle[1:] += np.where(moving, angle_diff * 0.1, 0)
+        
+        # Breathing animation
+        self.sbreath += 2 * dt
+        phase = (self.sbreath * _SIN_LUT_SCALE).astype(np.int64) & 1023
+        self.stension = 0.5 + 0.3 * _SIN_LUT[phase]
+        
     def grow(self):
-        tail = self.snake[-1]
-        new_segment = SnakeSegment(tail.x - 10, tail.y - 10, tail, len(self.snake))
-        self.snake.append(new_segment)
+        i = len(self.snake)
+        self.sx = np.append(self.sx, self.sx[-1] - 10)
+        self.sy = np.append(self.sy, self.sy[-1] - 10)
+        self.sangle = np.append(self.sangle, 0)
+        self.swidth = np.append(self.swidth, max(3, 25 - i * 1.2))
+        self.sbreath = np.append(self.sbreath, random.random() * 6.28)
+        self.stension = np.append(self.stension, 0)
+        self.snake.append(SnakeSegment(self, i))
+        self._draw_order = self.snake[::-1]
+        
+    def render_terrain(self):
+        # Composite the whole (static) world once; draw_terrain just blits it
+        colors, vegetation = generate_terrain()
+        pixels = colors.repeat(TILE_SIZE, axis=0).repeat(TILE_SIZE, axis=1)
+        surface = pygame.surfarray.make_surface(pixels)
+        rng = random.Random(vegetation.size)  # Stable grass, no per-frame flicker
+        
+        # Add texture details
+        for ix, iy in np.argwhere(vegetation > 30):
+            tile_x = int(ix) * TILE_SIZE
+            tile_y = int(iy) * TILE_SIZE
+            for _ in range(2):
+                grass_x = tile_x + rng.randint(0, 8)
+                grass_y = tile_y + rng.randint(0, 8)
+                pygame.draw.circle(surface, (20, 80, 20), (grass_x, grass_y), 1)
+        return surface.convert()
         
     def draw_terrain(self):
-        # Draw visible terrain
-        start_x = int((self.camera_x - 50) // 10) * 10
-        start_y = int((self.camera_y - 50) // 10) * 10
-        
-        for x in range(start_x, start_x + W + 100, 10):
-            for y in range(start_y, start_y + H + 100, 10):
-                if (x, y) in self.terrain:
-                    tile = self.terrain[(x, y)]
-                    screen_x = x - self.camera_x
-                    screen_y = y - self.camera_y
-                    
-                    if -20 < screen_x < W + 20 and -20 < screen_y < H + 20:
-                        pygame.draw.rect(self.screen, tile.color, 
-                                       (screen_x, screen_y, 10, 10))
-                        
-                        # Add texture details
-                        if tile.vegetation > 30:
-                            for _ in range(2):
-                                grass_x = screen_x + random.randint(0, 8)
-                                grass_y = screen_y + random.randint(0, 8)
-                                pygame.draw.circle(self.screen, (20, 80, 20), 
-                                                 (grass_x, grass_y), 1)
+        # SDL clips the blit to the visible part of the world
+        self.screen.blit(self.terrain_surface, 
+                        (TERRAIN_MIN - int(self.camera_x), TERRAIN_MIN - int(self.camera_y)))
     
     def draw_ui(self):
         # Realistic HUD
@@ -371,30 +517,37 @@ class RealisticEcosystem:
         self.screen.blit(inst, (10, H - 30))
         
     def run(self):
+        accumulator = 0.0
+        last_time = time.perf_counter()
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
                     
-            self.handle_input()
-            self.update()
+            # Fixed-step physics, independent of how fast we can render
+            now = time.perf_counter()
+            accumulator += min(now - last_time, 0.25)  # Don't spiral after a stall
+            last_time = now
+            while accumulator >= PHYSICS_STEP:
+                self.handle_input()
+                self.update()
+                accumulator -= PHYSICS_STEP
             
             self.screen.fill((0, 0, 0))
             self.draw_terrain()
             
             # Draw prey
-            for prey in self.prey:
-                prey.draw(self.screen, self.camera_x, self.camera_y)
+            self.prey.draw(self.screen, self.camera_x, self.camera_y)
                 
             # Draw snake
-            for segment in reversed(self.snake):
+            for segment in self._draw_order:
                 segment.draw(self.screen, self.camera_x, self.camera_y)
                 
             self.draw_ui()
             
             pygame.display.flip()
-            self.clock.tick(60)
+            self.clock.tick(RENDER_FPS)
 
 if __name__ == "__main__":
     try:
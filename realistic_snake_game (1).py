@@ -3,8 +3,9 @@ import random
 import math
 import sys
 from enum import Enum
+from collections import deque
 from typing import List, Tuple
-import time
+import numpy as np
 
 # Initialize Pygame
 pygame.init()
@@ -15,6 +16,12 @@ WINDOW_HEIGHT = 800
 GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
+HALF_GRID = GRID_SIZE // 2
+# Occupancy grid cell states
+CELL_FREE, CELL_SNAKE, CELL_OBSTACLE, CELL_APPLE = 0, 1, 2, 3
+
+LOGIC_DT = 1 / 30  # Fixed game-logic tick; rendering and animation stay per frame
+MAX_LOGIC_BACKLOG = 0.25  # Cap on unsimulated time, so a stall can't burst many ticks at once
 
 # Colors with realistic tones
 COLORS = {
@@ -40,47 +47,94 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
-class Particle:
-    def __init__(self, x, y, color, velocity, lifetime):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        
-    def update(self, dt):
-        self.x += self.velocity[0] * dt
-        self.y += self.velocity[1] * dt
-        self.lifetime -= dt
-        
-    def draw(self, screen):
-        if self.lifetime > 0:
-            alpha = int(255 * (self.lifetime / self.max_lifetime))
-            color = (*self.color[:3], alpha)
-            size = max(1, int(3 * (self.lifetime / self.max_lifetime)))
-            pygame.draw.circle(screen, color[:3], (int(self.x), int(self.y)), size)
+DIRECTION_KEYS = {
+    pygame.K_UP: Direction.UP, pygame.K_w: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN, pygame.K_s: Direction.DOWN,
+    pygame.K_LEFT: Direction.LEFT, pygame.K_a: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT, pygame.K_d: Direction.RIGHT
+}
+
+def step_particles(pos, vel, life, dt, scratch):
+    """Advance particle rows in place; scratch avoids a temporary per frame"""
+    np.multiply(vel, dt, out=scratch)
+    pos += scratch
+    life -= dt
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    """Particles stored as struct-of-arrays so updates are whole-array ops"""
+    def __init__(self, capacity=256):
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color_idx = np.zeros(capacity, dtype=np.uint8)
+        self.palette = []  # Explosion colors, indexed by color_idx
+        self.scratch = np.zeros((capacity, 2), dtype=np.float32)
+        self.count = 0
+        self.sprites = {}  # (rgb, radius) -> pre-rendered circle
+    
+    def get_sprite(self, color, size):
+        key = (color[:3], size)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, key[0], (size, size), size)
+            sprite = self.sprites[key] = sprite.convert_alpha()
+        return sprite
+    
+    def reserve(self, extra):
+        needed = self.count + extra
+        capacity = len(self.life)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ('pos', 'vel', 'life', 'max_life', 'color_idx', 'scratch'):
+            old = getattr(self, name)
+            grown = np.ones((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
     
     def add_explosion(self, x, y, color, count=15):
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            lifetime = random.uniform(0.5, 1.5)
-            self.particles.append(Particle(x, y, color, velocity, lifetime))
+        color = tuple(color[:3])
+        if color not in self.palette:
+            self.palette.append(color)
+        self.reserve(count)
+        
+        rows = slice(self.count, self.count + count)
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        speed = np.random.uniform(50, 150, count)
+        self.pos[rows] = (x, y)
+        self.vel[rows, 0] = np.cos(angle) * speed
+        self.vel[rows, 1] = np.sin(angle) * speed
+        self.life[rows] = self.max_life[rows] = np.random.uniform(0.5, 1.5, count)
+        self.color_idx[rows] = self.palette.index(color)
+        self.count += count
     
     def update(self, dt):
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for particle in self.particles:
-            particle.update(dt)
+        # Drop expired particles by moving the last live row into each hole;
+        # going high-to-low means the row moved in is always a live one
+        n = self.count
+        for i in np.flatnonzero(self.life[:n] <= 0)[::-1].tolist():
+            n -= 1
+            if i != n:
+                for arr in (self.pos, self.vel, self.life, self.max_life, self.color_idx):
+                    arr[i] = arr[n]
+        self.count = n
+        
+        step_particles(self.pos[:n], self.vel[:n], self.life[:n], dt, self.scratch[:n])
     
     def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+        n = self.count
+        alive = self.life[:n] > 0
+        sizes = np.maximum(1, (3 * (self.life[:n] / self.max_life[:n])).astype(np.int32))[alive]
+        points = self.pos[:n][alive].astype(np.int32)
+        colors = self.color_idx[:n][alive]
+        
+        blit_list = []
+        for (x, y), size, color in zip(points.tolist(), sizes.tolist(), colors.tolist()):
+            blit_list.append((self.get_sprite(self.palette[color], size), (x - size, y - size)))
+        return screen.blits(blit_list)
 
 class SnakeSegment:
     def __init__(self, x, y, is_head=False):
@@ -105,6 +159,9 @@ class Apple:
         self.y = y
         self.pulse_time = 0
         self.sparkle_particles = []
+        # Pixel center, fixed for the apple's lifetime
+        self.center_x = x * GRID_SIZE + HALF_GRID
+        self.center_y = y * GRID_SIZE + HALF_GRID
         
     def update(self, dt):
         self.pulse_time += dt * 3
@@ -113,8 +170,8 @@ class Apple:
             offset_x = random.randint(-10, 10)
             offset_y = random.randint(-10, 10)
             self.sparkle_particles.append({
-                'x': self.x * GRID_SIZE + GRID_SIZE//2 + offset_x,
-                'y': self.y * GRID_SIZE + GRID_SIZE//2 + offset_y,
+                'x': self.center_x + offset_x,
+                'y': self.center_y + offset_y,
                 'life': 1.0
             })
         
@@ -130,8 +187,7 @@ class Apple:
         size = int(GRID_SIZE * 0.8 * pulse)
         
         # Apple position
-        apple_x = self.x * GRID_SIZE + GRID_SIZE // 2
-        apple_y = self.y * GRID_SIZE + GRID_SIZE // 2
+        apple_x, apple_y = self.center_x, self.center_y
         
         # Draw shadow
         shadow_offset = 3
@@ -159,26 +215,32 @@ class Apple:
             sparkle_size = max(1, int(3 * sparkle['life']))
             pygame.draw.circle(screen, (255, 255, 0), 
                              (int(sparkle['x']), int(sparkle['y'])), sparkle_size)
+        
+        # Pulse, shadow and sparkles (offset <= 10, radius <= 3) all fit in here
+        return pygame.Rect(apple_x - GRID_SIZE, apple_y - GRID_SIZE, GRID_SIZE * 2, GRID_SIZE * 2)
 
 class Obstacle:
+    VARIANTS = 4  # Pre-rendered rock textures to pick from
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.damage_level = 0
-        
-    def draw(self, screen):
-        # Rock-like obstacle with 3D effect
-        obstacle_x = self.x * GRID_SIZE
-        obstacle_y = self.y * GRID_SIZE
+        self.variant = random.randrange(Obstacle.VARIANTS)
+    
+    @staticmethod
+    def create_sprite():
+        # Rock-like obstacle with 3D effect, rendered once per variant
+        sprite = pygame.Surface((GRID_SIZE + 2, GRID_SIZE + 2), pygame.SRCALPHA)
         
         # Draw shadow
-        shadow_rect = pygame.Rect(obstacle_x + 2, obstacle_y + 2, GRID_SIZE, GRID_SIZE)
-        pygame.draw.rect(screen, (0, 0, 0, 80), shadow_rect)
+        shadow_rect = pygame.Rect(2, 2, GRID_SIZE, GRID_SIZE)
+        pygame.draw.rect(sprite, (0, 0, 0, 80), shadow_rect)
         
         # Draw multiple layers for 3D effect
         for layer in range(3):
             offset = layer * 2
-            layer_rect = pygame.Rect(obstacle_x + offset, obstacle_y + offset, 
+            layer_rect = pygame.Rect(offset, offset, 
                                    GRID_SIZE - offset*2, GRID_SIZE - offset*2)
             
             if layer == 0:
@@ -188,15 +250,16 @@ class Obstacle:
             else:
                 color = (160, 90, 40)  # Lighter brown
                 
-            pygame.draw.rect(screen, color, layer_rect)
-            pygame.draw.rect(screen, (0, 0, 0), layer_rect, 1)
+            pygame.draw.rect(sprite, color, layer_rect)
+            pygame.draw.rect(sprite, (0, 0, 0), layer_rect, 1)
         
         # Add texture details
         for i in range(3):
-            detail_x = obstacle_x + random.randint(2, GRID_SIZE-4)
-            detail_y = obstacle_y + random.randint(2, GRID_SIZE-4)
-            pygame.draw.circle(screen, COLORS['OBSTACLE_DARK'], 
+            detail_x = random.randint(2, GRID_SIZE-4)
+            detail_y = random.randint(2, GRID_SIZE-4)
+            pygame.draw.circle(sprite, COLORS['OBSTACLE_DARK'], 
                              (detail_x, detail_y), 1)
+        return sprite.convert_alpha()
 
 class Snake:
     def __init__(self, start_x, start_y):
@@ -206,20 +269,24 @@ class Snake:
         self.growing = False
         self.move_timer = 0
         self.move_delay = 0.15  # Smooth movement timing
+        # Cells under segments[1:], head-side first, plus a set for O(1) probes
+        self.body = deque()
+        self.body_cells = set()
         
     def update(self, dt):
         self.move_timer += dt
-        
+        if self.move_timer >= self.move_delay:
+            # Keep the remainder so coarse logic ticks don't round the speed down
+            self.move_timer -= self.move_delay
+            self.move()
+    
+    def update_smooth(self):
         # Update smooth positions for all segments
         for segment in self.segments:
             segment.update_smooth_position(0.3)
-        
-        if self.move_timer >= self.move_delay:
-            self.move_timer = 0
-            self.move()
     
     def set_direction(self, direction):
-        # Prevent immediate reversal
+        # Prevent immediate reversal; returns whether the direction was taken
         if len(self.segments) > 1:
             opposite = {
                 Direction.UP: Direction.DOWN,
@@ -227,10 +294,10 @@ class Snake:
                 Direction.LEFT: Direction.RIGHT,
                 Direction.RIGHT: Direction.LEFT
             }
-            if direction != opposite[self.direction]:
-                self.next_direction = direction
-        else:
-            self.next_direction = direction
+            if direction == opposite[self.direction]:
+                return False
+        self.next_direction = direction
+        return True
     
     def move(self):
         self.direction = self.next_direction
@@ -242,6 +309,7 @@ class Snake:
         
         # Move head
         head = self.segments[0]
+        old_head = (head.x, head.y)
         dx, dy = self.direction.value
         head.x += dx
         head.y += dy
@@ -251,12 +319,18 @@ class Snake:
             self.segments[i].x = self.segments[i-1].prev_x
             self.segments[i].y = self.segments[i-1].prev_y
         
+        # The old head cell joins the body; the tail cell leaves unless growing
+        self.body.appendleft(old_head)
+        self.body_cells.add(old_head)
+        
         # Handle growing
         if self.growing:
             tail = self.segments[-1]
             new_segment = SnakeSegment(tail.prev_x, tail.prev_y)
             self.segments.append(new_segment)
             self.growing = False
+        else:
+            self.body_cells.discard(self.body.pop())
     
     def grow(self):
         self.growing = True
@@ -265,7 +339,7 @@ class Snake:
         return (self.segments[0].x, self.segments[0].y)
     
     def check_collision(self, x, y):
-        return any(segment.x == x and segment.y == y for segment in self.segments)
+        return (x, y) in self.body_cells or (x, y) == self.get_head_position()
     
     def check_wall_collision(self):
         head_x, head_y = self.get_head_position()
@@ -273,12 +347,11 @@ class Snake:
                 head_y < 0 or head_y >= GRID_HEIGHT)
     
     def check_self_collision(self):
-        head_pos = self.get_head_position()
-        return any(segment.x == head_pos[0] and segment.y == head_pos[1] 
-                  for segment in self.segments[1:])
+        return self.get_head_position() in self.body_cells
     
     def draw(self, screen):
-        # Draw snake with realistic segments
+        # Draw snake with realistic segments; returns the screen areas touched
+        rects = []
         for i, segment in enumerate(self.segments):
             x = int(segment.smooth_x)
             y = int(segment.smooth_y)
@@ -289,6 +362,8 @@ class Snake:
             else:
                 # Draw body segment with scales
                 self.draw_body_segment(screen, x, y, i)
+            rects.append(pygame.Rect(x, y, GRID_SIZE + 2, GRID_SIZE + 2))  # + shadow
+        return rects
     
     def draw_head(self, screen, x, y):
         head_rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
@@ -325,13 +400,13 @@ class Snake:
         # Draw nostrils
         nostril_color = (40, 60, 40)
         if self.direction == Direction.RIGHT:
-            nostril_pos = (x + GRID_SIZE - 4, y + GRID_SIZE // 2)
+            nostril_pos = (x + GRID_SIZE - 4, y + HALF_GRID)
         elif self.direction == Direction.LEFT:
-            nostril_pos = (x + 2, y + GRID_SIZE // 2)
+            nostril_pos = (x + 2, y + HALF_GRID)
         elif self.direction == Direction.UP:
-            nostril_pos = (x + GRID_SIZE // 2, y + 2)
+            nostril_pos = (x + HALF_GRID, y + 2)
         else:  # DOWN
-            nostril_pos = (x + GRID_SIZE // 2, y + GRID_SIZE - 4)
+            nostril_pos = (x + HALF_GRID, y + GRID_SIZE - 4)
         
         pygame.draw.circle(screen, nostril_color, nostril_pos, 1)
     
@@ -364,9 +439,19 @@ class Game:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Ultra Realistic Snake Game")
+        # Directions are polled per logic tick; only these events need queueing
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 72)
+        self.small_font = pygame.font.Font(None, 24)
+        self.create_static_texts()
+        self.ui_cache = {}  # label -> (text, rendered surface)
+        self.background = self.create_background()
+        self.grid_overlay = self.create_grid_overlay()
+        self.obstacle_sprites = [Obstacle.create_sprite() for _ in range(Obstacle.VARIANTS)]
+        self.dirty_rects = []  # Areas drawn last frame, to restore and refresh
         
         self.reset_game()
         self.particle_system = ParticleSystem()
@@ -375,40 +460,47 @@ class Game:
         self.snake = Snake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
         self.apple = None
         self.obstacles = []
+        self.occupancy = np.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=np.uint8)
         self.score = 0
         self.apples_eaten = 0
         self.game_over = False
         self.paused = False
+        self.tapped_direction = None  # Latest direction KEYDOWN, until a tick consumes it
+        self.speed_label = f"Speed: {1/self.snake.move_delay:.1f}"
         self.spawn_apple()
-        
+        self.create_static_background()
+        
+    def free_cells(self):
+        # Flat indices (x * GRID_HEIGHT + y) of cells with nothing on them.
+        # The snake moves every tick, so it is stamped here rather than tracked.
+        occupied = self.occupancy.copy()
+        for segment in self.snake.segments:
+            occupied[segment.x, segment.y] = CELL_SNAKE
+        return np.flatnonzero(occupied == CELL_FREE)
+    
     def spawn_apple(self):
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            
-            # Check if position is free
-            if not self.snake.check_collision(x, y) and not self.is_obstacle(x, y):
-                self.apple = Apple(x, y)
-                break
+        if self.apple:
+            self.occupancy[self.apple.x, self.apple.y] = CELL_FREE
+        
+        free = self.free_cells()
+        if free.size:
+            x, y = divmod(int(free[random.randrange(free.size)]), GRID_HEIGHT)
+            self.apple = Apple(x, y)
+            self.occupancy[x, y] = CELL_APPLE
     
     def spawn_obstacles(self):
         obstacle_count = min(10, (self.apples_eaten // 5) * 2 + 2)
         
-        for _ in range(obstacle_count):
-            attempts = 0
-            while attempts < 50:  # Prevent infinite loop
-                x = random.randint(0, GRID_WIDTH - 1)
-                y = random.randint(0, GRID_HEIGHT - 1)
-                
-                if (not self.snake.check_collision(x, y) and 
-                    not self.is_obstacle(x, y) and 
-                    (x != self.apple.x or y != self.apple.y)):
-                    self.obstacles.append(Obstacle(x, y))
-                    break
-                attempts += 1
+        free = self.free_cells()
+        for pick in random.sample(range(free.size), min(obstacle_count, free.size)):
+            x, y = divmod(int(free[pick]), GRID_HEIGHT)
+            self.obstacles.append(Obstacle(x, y))
+            self.occupancy[x, y] = CELL_OBSTACLE
+        self.create_static_background()
     
     def is_obstacle(self, x, y):
-        return any(obs.x == x and obs.y == y for obs in self.obstacles)
+        return (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT and 
+                self.occupancy[x, y] == CELL_OBSTACLE)
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -422,15 +514,9 @@ class Game:
                     self.reset_game()
                 elif event.key == pygame.K_SPACE:
                     self.paused = not self.paused
-                elif not self.game_over and not self.paused:
-                    if event.key in [pygame.K_UP, pygame.K_w]:
-                        self.snake.set_direction(Direction.UP)
-                    elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                        self.snake.set_direction(Direction.DOWN)
-                    elif event.key in [pygame.K_LEFT, pygame.K_a]:
-                        self.snake.set_direction(Direction.LEFT)
-                    elif event.key in [pygame.K_RIGHT, pygame.K_d]:
-                        self.snake.set_direction(Direction.RIGHT)
+                elif event.key in DIRECTION_KEYS:
+                    # Latched so taps shorter than a logic tick still turn the snake
+                    self.tapped_direction = DIRECTION_KEYS[event.key]
         
         return True
     
@@ -438,12 +524,18 @@ class Game:
         if self.game_over or self.paused:
             return
         
-        self.snake.update(dt)
-        
-        if self.apple:
-            self.apple.update(dt)
+        # A latched tap wins. Otherwise, while no turn is queued, poll held keys
+        # for a turn; a held reversal or the current heading doesn't hide the rest
+        snake = self.snake
+        tapped, self.tapped_direction = self.tapped_direction, None
+        if ((tapped is None or not snake.set_direction(tapped)) and 
+                snake.next_direction == snake.direction):
+            keys = pygame.key.get_pressed()
+            for key, direction in DIRECTION_KEYS.items():
+                if keys[key] and direction != snake.direction and snake.set_direction(direction):
+                    break
         
-        self.particle_system.update(dt)
+        self.snake.update(dt)
         
         # Check apple collision
         head_pos = self.snake.get_head_position()
@@ -454,9 +546,7 @@ class Game:
             self.apples_eaten += 1
             
             # Add explosion effect
-            apple_pixel_x = self.apple.x * GRID_SIZE + GRID_SIZE // 2
-            apple_pixel_y = self.apple.y * GRID_SIZE + GRID_SIZE // 2
-            self.particle_system.add_explosion(apple_pixel_x, apple_pixel_y, 
+            self.particle_system.add_explosion(self.apple.center_x, self.apple.center_y, 
                                              COLORS['APPLE_RED'], 20)
             
             # Spawn new apple
@@ -467,126 +557,176 @@ class Game:
                 self.spawn_obstacles()
                 # Speed up snake slightly
                 self.snake.move_delay = max(0.08, self.snake.move_delay - 0.01)
+                self.speed_label = f"Speed: {1/self.snake.move_delay:.1f}"
         
-        # Check collisions
+        # Check collisions; the first hit ends the game
         head_x, head_y = head_pos
         
         # Wall collision
         if self.snake.check_wall_collision():
-            self.game_over = True
-            self.particle_system.add_explosion(head_x * GRID_SIZE + GRID_SIZE//2,
-                                             head_y * GRID_SIZE + GRID_SIZE//2,
-                                             COLORS['SNAKE_HEAD'], 30)
+            self.die(head_x, head_y, COLORS['SNAKE_HEAD'])
+            return
         
         # Self collision
         if self.snake.check_self_collision():
-            self.game_over = True
-            self.particle_system.add_explosion(head_x * GRID_SIZE + GRID_SIZE//2,
-                                             head_y * GRID_SIZE + GRID_SIZE//2,
-                                             COLORS['SNAKE_HEAD'], 30)
+            self.die(head_x, head_y, COLORS['SNAKE_HEAD'])
+            return
         
         # Obstacle collision
         if self.is_obstacle(head_x, head_y):
-            self.game_over = True
-            self.particle_system.add_explosion(head_x * GRID_SIZE + GRID_SIZE//2,
-                                             head_y * GRID_SIZE + GRID_SIZE//2,
-                                             COLORS['OBSTACLE_BROWN'], 30)
+            self.die(head_x, head_y, COLORS['OBSTACLE_BROWN'])
+    
+    def die(self, head_x, head_y, color):
+        self.game_over = True
+        self.particle_system.add_explosion(head_x * GRID_SIZE + HALF_GRID,
+                                         head_y * GRID_SIZE + HALF_GRID,
+                                         color, 30)
     
-    def draw_grid(self):
+    def create_background(self):
+        # The gradient never changes, so paint its rows once
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        for y in range(WINDOW_HEIGHT):
+            color_factor = y / WINDOW_HEIGHT
+            r = int(COLORS['DARK_GREEN'][0] * (1 - color_factor * 0.3))
+            g = int(COLORS['DARK_GREEN'][1] * (1 - color_factor * 0.3))
+            b = int(COLORS['DARK_GREEN'][2] * (1 - color_factor * 0.3))
+            pygame.draw.line(background, (r, g, b), (0, y), (WINDOW_WIDTH, y))
+        return background
+    
+    def create_grid_overlay(self):
+        # Transparent everywhere except the static grid lines
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA).convert_alpha()
         for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, COLORS['GRID_LINE'], 
+            pygame.draw.line(overlay, COLORS['GRID_LINE'], 
                            (x, 0), (x, WINDOW_HEIGHT), 1)
         for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, COLORS['GRID_LINE'], 
+            pygame.draw.line(overlay, COLORS['GRID_LINE'], 
                            (0, y), (WINDOW_WIDTH, y), 1)
+        return overlay
     
-    def draw_ui(self):
-        # Score
-        score_text = self.font.render(f"Score: {self.score}", True, COLORS['UI_GREEN'])
-        self.screen.blit(score_text, (10, 10))
-        
-        # Apples eaten
-        apples_text = self.font.render(f"Apples: {self.apples_eaten}", True, COLORS['UI_GREEN'])
-        self.screen.blit(apples_text, (10, 50))
+    def animate(self, dt):
+        # Per-frame visuals, kept at render rate for smooth motion
+        if self.game_over or self.paused:
+            return
         
-        # Speed indicator
-        speed_text = self.font.render(f"Speed: {1/self.snake.move_delay:.1f}", True, COLORS['UI_GREEN'])
-        self.screen.blit(speed_text, (10, 90))
+        self.snake.update_smooth()
         
-        # Obstacles count
-        obs_text = self.font.render(f"Obstacles: {len(self.obstacles)}", True, COLORS['UI_GREEN'])
-        self.screen.blit(obs_text, (10, 130))
+        if self.apple:
+            self.apple.update(dt)
         
-        if self.paused:
-            pause_text = self.big_font.render("PAUSED", True, COLORS['WHITE'])
-            text_rect = pause_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-            self.screen.blit(pause_text, text_rect)
+        self.particle_system.update(dt)
+    
+    def create_static_background(self):
+        # Gradient, grid and obstacles only change on reset or a new obstacle wave
+        self.static_background = self.background.copy()
+        self.static_background.blit(self.grid_overlay, (0, 0))
+        self.static_background.blits([(self.obstacle_sprites[obstacle.variant], 
+                                       (obstacle.x * GRID_SIZE, obstacle.y * GRID_SIZE)) 
+                                      for obstacle in self.obstacles], doreturn=False)
+        self.full_redraw = True
+    
+    def create_static_texts(self):
+        # Text that never changes is rasterized once
+        self.pause_text = self.big_font.render("PAUSED", True, COLORS['WHITE'])
+        self.pause_rect = self.pause_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
         
-        if self.game_over:
-            game_over_text = self.big_font.render("GAME OVER", True, COLORS['APPLE_RED'])
-            restart_text = self.font.render("Press R to restart", True, COLORS['WHITE'])
-            
-            go_rect = game_over_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-            r_rect = restart_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 20))
-            
-            self.screen.blit(game_over_text, go_rect)
-            self.screen.blit(restart_text, r_rect)
+        self.game_over_text = self.big_font.render("GAME OVER", True, COLORS['APPLE_RED'])
+        self.restart_text = self.font.render("Press R to restart", True, COLORS['WHITE'])
+        self.game_over_rect = self.game_over_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
+        self.restart_rect = self.restart_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 20))
         
-        # Controls
         controls = [
             "WASD/Arrow Keys: Move",
             "Space: Pause",
             "R: Restart (when game over)",
             "ESC: Quit"
         ]
+        self.control_texts = [self.small_font.render(control, True, COLORS['WHITE']) 
+                              for control in controls]
+    
+    def render_label(self, key, text):
+        # Re-rasterize a HUD label only when its text actually changed
+        cached = self.ui_cache.get(key)
+        if cached is None or cached[0] != text:
+            cached = self.ui_cache[key] = (text, self.font.render(text, True, COLORS['UI_GREEN']))
+        return cached[1]
+    
+    def draw_ui(self):
+        blit_list = [
+            # Score
+            (self.render_label('score', f"Score: {self.score}"), (10, 10)),
+            # Apples eaten
+            (self.render_label('apples', f"Apples: {self.apples_eaten}"), (10, 50)),
+            # Speed indicator
+            (self.render_label('speed', self.speed_label), (10, 90)),
+            # Obstacles count
+            (self.render_label('obstacles', f"Obstacles: {len(self.obstacles)}"), (10, 130))
+        ]
+        
+        if self.paused:
+            blit_list.append((self.pause_text, self.pause_rect))
+        
+        if self.game_over:
+            blit_list.append((self.game_over_text, self.game_over_rect))
+            blit_list.append((self.restart_text, self.restart_rect))
+        
+        # Controls
+        for i, text in enumerate(self.control_texts):
+            blit_list.append((text, (WINDOW_WIDTH - 250, 10 + i * 25)))
         
-        for i, control in enumerate(controls):
-            text = pygame.font.Font(None, 24).render(control, True, COLORS['WHITE'])
-            self.screen.blit(text, (WINDOW_WIDTH - 250, 10 + i * 25))
+        return self.screen.blits(blit_list)
     
     def draw(self):
-        # Background gradient
-        for y in range(WINDOW_HEIGHT):
-            color_factor = y / WINDOW_HEIGHT
-            r = int(COLORS['DARK_GREEN'][0] * (1 - color_factor * 0.3))
-            g = int(COLORS['DARK_GREEN'][1] * (1 - color_factor * 0.3))
-            b = int(COLORS['DARK_GREEN'][2] * (1 - color_factor * 0.3))
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (WINDOW_WIDTH, y))
-        
-        self.draw_grid()
+        """Draw the frame and return the screen rects that need presenting"""
+        # Background gradient, grid and obstacles: restore only what was drawn over
+        if self.full_redraw:
+            self.screen.blit(self.static_background, (0, 0))
+        else:
+            for rect in self.dirty_rects:
+                self.screen.blit(self.static_background, rect, rect)
         
-        # Draw obstacles
-        for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
+        rects = []
         
         # Draw apple
         if self.apple:
-            self.apple.draw(self.screen)
+            rects.append(self.apple.draw(self.screen))
         
         # Draw snake
-        self.snake.draw(self.screen)
+        rects.extend(self.snake.draw(self.screen))
         
         # Draw particles
-        self.particle_system.draw(self.screen)
+        rects.extend(self.particle_system.draw(self.screen))
         
         # Draw UI
-        self.draw_ui()
+        rects.extend(self.draw_ui())
+        
+        # Present both where things were and where they are now
+        if self.full_redraw:
+            self.full_redraw = False
+            changed = [self.screen.get_rect()]
+        else:
+            changed = self.dirty_rects + rects
+        self.dirty_rects = rects
+        return changed
     
     def run(self):
         running = True
-        last_time = time.time()
+        logic_acc = 0.0
+        dt = 0.0
         
         while running:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-            
             running = self.handle_events()
-            self.update(dt)
-            self.draw()
             
-            pygame.display.flip()
-            self.clock.tick(60)  # 60 FPS for smooth animation
+            # Game logic on a fixed tick, independent of the frame rate
+            logic_acc = min(logic_acc + dt, MAX_LOGIC_BACKLOG)
+            while logic_acc >= LOGIC_DT:
+                self.update(LOGIC_DT)
+                logic_acc -= LOGIC_DT
+            
+            self.animate(dt)
+            pygame.display.update(self.draw())
+            # 60 FPS for smooth animation; tick() also reports the frame time
+            dt = self.clock.tick(60) / 1000.0
         
         pygame.quit()
         sys.exit()
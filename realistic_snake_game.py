@@ -3,7 +3,9 @@ import random
 import math
 import sys
 from enum import Enum
-import time
+from collections import deque
+from itertools import islice
+import numpy as np
 
 # Initialize Pygame
 pygame.init()
@@ -15,6 +17,12 @@ GRID_SIZE = 25  # Larger grid for better performance
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
 FPS = 30  # Reduced FPS for Pi Zero 2W
+# Pixel offset of each grid column / row, so draws index instead of multiply.
+# A head one cell past a wall (index -1 or GRID_WIDTH/HEIGHT) still lands off-screen.
+COL_PX = tuple(range(0, WINDOW_WIDTH + GRID_SIZE, GRID_SIZE))
+ROW_PX = tuple(range(0, WINDOW_HEIGHT + GRID_SIZE, GRID_SIZE))
+# Every grid cell, row-major to line up with Game.obstacle_grid
+ALL_CELLS = tuple((x, y) for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH))
 
 # Simplified colors for better performance
 COLORS = {
@@ -30,84 +38,139 @@ COLORS = {
     'UI_GREEN': (50, 205, 50)
 }
 
+# Apple pulse sine lookup: index with int(phase * _SIN_LUT_SCALE) & 255
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+_SIN_LUT_SCALE = 256 / (2 * math.pi)
+# (cos, sin) of 256 evenly spaced angles, for explosion directions
+_UNIT_CIRCLE = np.array([(math.cos(2 * math.pi * i / 256), math.sin(2 * math.pi * i / 256)) 
+                         for i in range(256)], dtype=np.float32)
+
 class Direction(Enum):
     UP = (0, -1)
     DOWN = (0, 1)
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
-class Particle:
-    """Lightweight particle for Pi Zero 2W"""
-    def __init__(self, x, y, velocity, lifetime):
-        self.x = x
-        self.y = y
-        self.vx, self.vy = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        
-    def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
-        
-    def draw(self, screen):
-        if self.lifetime > 0:
-            alpha_factor = self.lifetime / self.max_lifetime
-            size = max(1, int(2 * alpha_factor))
-            pygame.draw.circle(screen, COLORS['APPLE_RED'], 
-                             (int(self.x), int(self.y)), size)
+# Movement keys, polled with pygame.key.get_pressed() each frame
+DIRECTION_KEYS = {
+    pygame.K_UP: Direction.UP, pygame.K_w: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN, pygame.K_s: Direction.DOWN,
+    pygame.K_LEFT: Direction.LEFT, pygame.K_a: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT, pygame.K_d: Direction.RIGHT
+}
 
 class ParticleSystem:
-    """Optimized particle system"""
+    """Optimized particle system, stored as NumPy struct-of-arrays"""
     def __init__(self):
-        self.particles = []
         self.max_particles = 20  # Limit particles for performance
+        capacity = self.max_particles * 2  # An explosion may start just under the limit
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.n = 0
+        self.stamps = {}  # radius -> (dx, dy) pixel offsets covered by that circle
+    
+    def get_stamp(self, size):
+        stamp = self.stamps.get(size)
+        if stamp is None:
+            mask = pygame.Surface((2 * size + 1, 2 * size + 1))
+            pygame.draw.circle(mask, COLORS['WHITE'], (size, size), size)
+            dx, dy = np.nonzero(pygame.surfarray.array2d(mask))
+            stamp = self.stamps[size] = (dx - size, dy - size)
+        return stamp
     
     def add_explosion(self, x, y, count=8):  # Reduced particle count
-        if len(self.particles) > self.max_particles:
+        if self.n > self.max_particles:
             return
-            
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(30, 80)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            lifetime = random.uniform(0.3, 0.8)
-            self.particles.append(Particle(x, y, velocity, lifetime))
+        
+        count = min(count, len(self.life) - self.n)
+        live = slice(self.n, self.n + count)
+        unit = _UNIT_CIRCLE[np.random.randint(0, 256, count)]
+        speeds = np.random.uniform(30, 80, count)
+        self.x[live] = x
+        self.y[live] = y
+        self.vx[live] = unit[:, 0] * speeds
+        self.vy[live] = unit[:, 1] * speeds
+        self.life[live] = self.max_life[live] = np.random.uniform(0.3, 0.8, count)
+        self.n += count
     
     def update(self, dt):
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for particle in self.particles:
-            particle.update(dt)
+        # Free dead slots in place by moving the last live slot into each one
+        # (high-to-low, so the slot moved in is always live), then advance all
+        n = self.n
+        for i in np.flatnonzero(self.life[:n] <= 0)[::-1].tolist():
+            n -= 1
+            if i != n:
+                for arr in (self.x, self.y, self.vx, self.vy, self.life, self.max_life):
+                    arr[i] = arr[n]
+        self.n = n
+        
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
     
     def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+        n = self.n
+        mask = self.life[:n] > 0
+        sizes = np.maximum(1, (2 * self.life[:n] / self.max_life[:n]).astype(np.int32))[mask]
+        xs = self.x[:n][mask].astype(np.int32)
+        ys = self.y[:n][mask].astype(np.int32)
+        if not len(xs):
+            return []
+        
+        # Write every particle's pixels straight into the screen, one store per radius.
+        # pixels3d only handles 24/32-bit surfaces and pixels2d every depth but 24,
+        # so a 16-bit (or 8-bit) framebuffer takes the mapped color through pixels2d.
+        width, height = screen.get_size()
+        if screen.get_bytesize() == 3:
+            pixels = pygame.surfarray.pixels3d(screen)
+            color = COLORS['APPLE_RED']
+        else:
+            pixels = pygame.surfarray.pixels2d(screen)
+            color = screen.map_rgb(COLORS['APPLE_RED'])
+        for size in np.unique(sizes).tolist():
+            dx, dy = self.get_stamp(size)
+            same = sizes == size
+            px = (xs[same, None] + dx).ravel()
+            py = (ys[same, None] + dy).ravel()
+            visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            pixels[px[visible], py[visible]] = color
+        del pixels  # Unlock the screen
+        
+        return [pygame.Rect(x - size, y - size, 2 * size + 1, 2 * size + 1) 
+                for x, y, size in zip(xs.tolist(), ys.tolist(), sizes.tolist())]
 
 class Snake:
+    __slots__ = ('segments', 'segment_set', 'hit_self', 'direction', 'next_direction', 
+                 'growing', 'move_delay', 'frames_per_move', 'move_counter')
+    
     def __init__(self, start_x, start_y):
-        self.segments = [(start_x, start_y)]
+        self.segments = deque([(start_x, start_y)])
+        self.segment_set = {(start_x, start_y)}  # Same cells, for O(1) lookups
+        self.hit_self = False
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
         self.growing = False
-        self.move_timer = 0
         self.move_delay = 0.2  # Slower for Pi Zero 2W
+        # The game runs at a fixed FPS, so movement is scheduled in whole frames
+        self.frames_per_move = round(self.move_delay * FPS)
+        self.move_counter = 0
         
-    def update(self, dt):
-        self.move_timer += dt
+    def update(self):
+        self.move_counter += 1
         
-        if self.move_timer >= self.move_delay:
-            self.move_timer = 0
+        if self.move_counter >= self.frames_per_move:
+            self.move_counter = 0
             self.move()
     
     def set_direction(self, direction):
         if len(self.segments) > 1:
-            opposite = {
-                Direction.UP: Direction.DOWN,
-                Direction.DOWN: Direction.UP,
-                Direction.LEFT: Direction.RIGHT,
-                Direction.RIGHT: Direction.LEFT
-            }
-            if direction != opposite[self.direction]:
+            # Reject a reversal: the opposite direction is the negated vector
+            dx, dy = self.direction.value
+            if direction.value != (-dx, -dy):
                 self.next_direction = direction
         else:
             self.next_direction = direction
@@ -120,14 +183,16 @@ class Snake:
         dx, dy = self.direction.value
         new_head = (head_x + dx, head_y + dy)
         
-        # Add new head
-        self.segments.insert(0, new_head)
-        
-        # Remove tail unless growing
+        # Remove tail unless growing; done first so the head may take its cell
         if not self.growing:
-            self.segments.pop()
+            self.segment_set.discard(self.segments.pop())
         else:
             self.growing = False
+        
+        # Add new head
+        self.hit_self = new_head in self.segment_set
+        self.segments.appendleft(new_head)
+        self.segment_set.add(new_head)
     
     def grow(self):
         self.growing = True
@@ -136,7 +201,7 @@ class Snake:
         return self.segments[0]
     
     def check_collision(self, x, y):
-        return (x, y) in self.segments
+        return (x, y) in self.segment_set
     
     def check_wall_collision(self):
         head_x, head_y = self.get_head_position()
@@ -144,45 +209,58 @@ class Snake:
                 head_y < 0 or head_y >= GRID_HEIGHT)
     
     def check_self_collision(self):
-        head = self.get_head_position()
-        return head in self.segments[1:]
+        return self.hit_self
     
-    def draw(self, screen):
-        for i, (x, y) in enumerate(self.segments):
-            pixel_x = x * GRID_SIZE
-            pixel_y = y * GRID_SIZE
-            rect = pygame.Rect(pixel_x, pixel_y, GRID_SIZE, GRID_SIZE)
-            
-            if i == 0:  # Head
-                # Draw head with simple details
-                pygame.draw.rect(screen, COLORS['SNAKE_HEAD'], rect)
-                pygame.draw.rect(screen, COLORS['BLACK'], rect, 2)
-                
-                # Simple eyes
-                eye_size = 3
-                if self.direction == Direction.RIGHT:
-                    eye1 = (pixel_x + GRID_SIZE - 8, pixel_y + 6)
-                    eye2 = (pixel_x + GRID_SIZE - 8, pixel_y + GRID_SIZE - 9)
-                elif self.direction == Direction.LEFT:
-                    eye1 = (pixel_x + 5, pixel_y + 6)
-                    eye2 = (pixel_x + 5, pixel_y + GRID_SIZE - 9)
-                elif self.direction == Direction.UP:
-                    eye1 = (pixel_x + 6, pixel_y + 5)
-                    eye2 = (pixel_x + GRID_SIZE - 9, pixel_y + 5)
-                else:  # DOWN
-                    eye1 = (pixel_x + 6, pixel_y + GRID_SIZE - 8)
-                    eye2 = (pixel_x + GRID_SIZE - 9, pixel_y + GRID_SIZE - 8)
-                
-                pygame.draw.circle(screen, COLORS['WHITE'], eye1, eye_size)
-                pygame.draw.circle(screen, COLORS['WHITE'], eye2, eye_size)
-                pygame.draw.circle(screen, COLORS['BLACK'], eye1, 1)
-                pygame.draw.circle(screen, COLORS['BLACK'], eye2, 1)
-                
-            else:  # Body
-                pygame.draw.rect(screen, COLORS['SNAKE_BODY'], rect)
-                pygame.draw.rect(screen, COLORS['BLACK'], rect, 1)
+    @staticmethod
+    def create_body_tile():
+        tile = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        rect = tile.get_rect()
+        tile.fill(COLORS['SNAKE_BODY'])
+        pygame.draw.rect(tile, COLORS['BLACK'], rect, 1)
+        return tile
+    
+    @staticmethod
+    def create_head_tile(direction):
+        tile = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        rect = tile.get_rect()
+        
+        # Draw head with simple details
+        tile.fill(COLORS['SNAKE_HEAD'])
+        pygame.draw.rect(tile, COLORS['BLACK'], rect, 2)
+        
+        # Simple eyes
+        eye_size = 3
+        if direction == Direction.RIGHT:
+            eye1 = (GRID_SIZE - 8, 6)
+            eye2 = (GRID_SIZE - 8, GRID_SIZE - 9)
+        elif direction == Direction.LEFT:
+            eye1 = (5, 6)
+            eye2 = (5, GRID_SIZE - 9)
+        elif direction == Direction.UP:
+            eye1 = (6, 5)
+            eye2 = (GRID_SIZE - 9, 5)
+        else:  # DOWN
+            eye1 = (6, GRID_SIZE - 8)
+            eye2 = (GRID_SIZE - 9, GRID_SIZE - 8)
+        
+        pygame.draw.circle(tile, COLORS['WHITE'], eye1, eye_size)
+        pygame.draw.circle(tile, COLORS['WHITE'], eye2, eye_size)
+        pygame.draw.circle(tile, COLORS['BLACK'], eye1, 1)
+        pygame.draw.circle(tile, COLORS['BLACK'], eye2, 1)
+        return tile
+    
+    def draw(self, screen, body_tile, head_tiles):
+        # Returns the screen areas touched
+        head_x, head_y = self.segments[0]
+        rects = [screen.blit(head_tiles[self.direction], (COL_PX[head_x], ROW_PX[head_y]))]
+        
+        rects.extend(screen.blits([(body_tile, (COL_PX[x], ROW_PX[y])) 
+                                   for x, y in islice(self.segments, 1, None)]))
+        return rects
 
 class Apple:
+    __slots__ = ('x', 'y', 'pulse_time')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -191,29 +269,33 @@ class Apple:
     def update(self, dt):
         self.pulse_time += dt * 2  # Slower pulse for performance
     
-    def draw(self, screen):
-        # Simple pulsing apple
-        pulse = 1 + 0.1 * math.sin(self.pulse_time)
+    @staticmethod
+    def create_sprite(size):
+        # Simple apple with highlight, centered in a grid cell
+        sprite = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+        center = GRID_SIZE // 2
+        pygame.draw.circle(sprite, COLORS['APPLE_RED'], (center, center), size//2)
+        highlight = center - size // 6
+        pygame.draw.circle(sprite, COLORS['APPLE_HIGHLIGHT'], 
+                         (highlight, highlight), max(1, size//6))
+        return sprite.convert_alpha()
+    
+    def draw(self, screen, sprites):
+        # Simple pulsing apple; the +/-10% pulse only spans a few integer sizes
+        pulse = 1 + 0.1 * _SIN_LUT[int(self.pulse_time * _SIN_LUT_SCALE) & 255]
         size = int(GRID_SIZE * 0.7 * pulse)
-        
-        apple_x = self.x * GRID_SIZE + GRID_SIZE // 2
-        apple_y = self.y * GRID_SIZE + GRID_SIZE // 2
-        
-        # Simple apple with highlight
-        pygame.draw.circle(screen, COLORS['APPLE_RED'], (apple_x, apple_y), size//2)
-        highlight_x = apple_x - size // 6
-        highlight_y = apple_y - size // 6
-        pygame.draw.circle(screen, COLORS['APPLE_HIGHLIGHT'], 
-                         (highlight_x, highlight_y), max(1, size//6))
+        return screen.blit(sprites[size], (COL_PX[self.x], ROW_PX[self.y]))
 
 class Obstacle:
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
         
     def draw(self, screen):
         # Simple obstacle
-        obstacle_rect = pygame.Rect(self.x * GRID_SIZE, self.y * GRID_SIZE, 
+        obstacle_rect = pygame.Rect(COL_PX[self.x], ROW_PX[self.y], 
                                   GRID_SIZE, GRID_SIZE)
         pygame.draw.rect(screen, COLORS['OBSTACLE'], obstacle_rect)
         pygame.draw.rect(screen, COLORS['BLACK'], obstacle_rect, 2)
@@ -228,60 +310,102 @@ class Game:
             self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
             
         pygame.display.set_caption("Pi Snake Game")
+        # Only discrete events go through the queue; movement keys are polled
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         
         # Use default font for better Pi compatibility
         self.font = pygame.font.Font(None, 28)
         self.big_font = pygame.font.Font(None, 48)
+        self.create_static_texts()
+        self.ui_cache = {}  # label -> (text, rendered surface)
+        
+        # Pre-rendered backgrounds, so a frame starts with a single blit
+        self.bg = self.create_background(grid=True)
+        self.bg_nogrid = self.create_background(grid=False)
+        self.body_tile = Snake.create_body_tile()
+        self.head_tiles = {direction: Snake.create_head_tile(direction) for direction in Direction}
+        self.apple_sprites = {size: Apple.create_sprite(size) 
+                              for size in range(int(GRID_SIZE * 0.7 * 0.9), int(GRID_SIZE * 0.7 * 1.1) + 1)}
+        self.show_grid = False  # Grid is only drawn once FPS is known to be good
+        self.dirty_rects = []  # Areas drawn last frame, to restore and refresh
         
         self.reset_game()
         self.particle_system = ParticleSystem()
         
         # Performance tracking
         self.frame_count = 0
-        self.last_fps_time = time.time()
+        self.last_fps_ticks = pygame.time.get_ticks()
         self.current_fps = 0
         
+    def create_background(self, grid):
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        background.fill(COLORS['DARK_GREEN'])
+        
+        if grid:
+            # One zig-zag polyline per direction. The joining runs lie on the
+            # x=0 / y=0 grid lines or just off-screen, so they draw nothing extra.
+            vertical = []
+            for i, x in enumerate(range(0, WINDOW_WIDTH, GRID_SIZE)):
+                ends = ((x, 0), (x, WINDOW_HEIGHT))
+                vertical.extend(ends if i % 2 == 0 else ends[::-1])
+            horizontal = []
+            for i, y in enumerate(range(0, WINDOW_HEIGHT, GRID_SIZE)):
+                ends = ((0, y), (WINDOW_WIDTH, y))
+                horizontal.extend(ends if i % 2 == 0 else ends[::-1])
+            pygame.draw.lines(background, COLORS['GRID_LINE'], False, vertical, 1)
+            pygame.draw.lines(background, COLORS['GRID_LINE'], False, horizontal, 1)
+        
+        return background
+    
+    def create_static_background(self):
+        # Background and obstacles only change on reset, new obstacles or a grid toggle
+        self.static_background = (self.bg if self.show_grid else self.bg_nogrid).copy()
+        for obstacle in self.obstacles:
+            obstacle.draw(self.static_background)
+        self.full_redraw = True
+    
     def reset_game(self):
         self.snake = Snake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
         self.apple = None
         self.obstacles = []
+        self.obstacle_grid = bytearray(GRID_WIDTH * GRID_HEIGHT)  # Row-major, 1 = obstacle
         self.score = 0
         self.apples_eaten = 0
         self.game_over = False
         self.paused = False
         self.spawn_apple()
-        
+        self.create_static_background()
+        
+    def free_cells(self):
+        # Cells with no snake or obstacle on them. Spawning is rare, so this is
+        # rebuilt on demand rather than kept in step with every snake move.
+        segment_set = self.snake.segment_set
+        return [cell for cell, blocked in zip(ALL_CELLS, self.obstacle_grid) 
+                if not blocked and cell not in segment_set]
+    
     def spawn_apple(self):
-        attempts = 0
-        while attempts < 100:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            
-            if not self.snake.check_collision(x, y) and not self.is_obstacle(x, y):
-                self.apple = Apple(x, y)
-                break
-            attempts += 1
+        free = self.free_cells()
+        self.apple = Apple(*random.choice(free)) if free else None
     
     def spawn_obstacles(self):
         # Fewer obstacles for Pi performance
         obstacle_count = min(6, (self.apples_eaten // 5) + 1)
         
-        for _ in range(obstacle_count):
-            attempts = 0
-            while attempts < 30:
-                x = random.randint(0, GRID_WIDTH - 1)
-                y = random.randint(0, GRID_HEIGHT - 1)
-                
-                if (not self.snake.check_collision(x, y) and 
-                    not self.is_obstacle(x, y) and 
-                    (self.apple is None or (x != self.apple.x or y != self.apple.y))):
-                    self.obstacles.append(Obstacle(x, y))
-                    break
-                attempts += 1
+        free = self.free_cells()
+        if self.apple:
+            free.remove((self.apple.x, self.apple.y))
+        
+        for x, y in random.sample(free, min(obstacle_count, len(free))):
+            self.obstacles.append(Obstacle(x, y))
+            self.obstacle_grid[y * GRID_WIDTH + x] = 1
+        self.create_static_background()
     
     def is_obstacle(self, x, y):
-        return any(obs.x == x and obs.y == y for obs in self.obstacles)
+        if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
+            return False
+        return self.obstacle_grid[y * GRID_WIDTH + x] != 0
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -295,15 +419,13 @@ class Game:
                     self.reset_game()
                 elif event.key == pygame.K_SPACE or event.key == pygame.K_p:
                     self.paused = not self.paused
-                elif not self.game_over and not self.paused:
-                    if event.key in [pygame.K_UP, pygame.K_w]:
-                        self.snake.set_direction(Direction.UP)
-                    elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                        self.snake.set_direction(Direction.DOWN)
-                    elif event.key in [pygame.K_LEFT, pygame.K_a]:
-                        self.snake.set_direction(Direction.LEFT)
-                    elif event.key in [pygame.K_RIGHT, pygame.K_d]:
-                        self.snake.set_direction(Direction.RIGHT)
+        
+        if not self.game_over and not self.paused:
+            keys = pygame.key.get_pressed()
+            for key, direction in DIRECTION_KEYS.items():
+                if keys[key]:
+                    self.snake.set_direction(direction)
+                    break
         
         return True
     
@@ -313,13 +435,13 @@ class Game:
         
         # Update FPS counter
         self.frame_count += 1
-        current_time = time.time()
-        if current_time - self.last_fps_time >= 1.0:
+        now = pygame.time.get_ticks()
+        if now - self.last_fps_ticks >= 1000:
             self.current_fps = self.frame_count
             self.frame_count = 0
-            self.last_fps_time = current_time
+            self.last_fps_ticks = now
         
-        self.snake.update(dt)
+        self.snake.update()
         
         if self.apple:
             self.apple.update(dt)
@@ -334,8 +456,8 @@ class Game:
             self.apples_eaten += 1
             
             # Add particles
-            apple_pixel_x = self.apple.x * GRID_SIZE + GRID_SIZE // 2
-            apple_pixel_y = self.apple.y * GRID_SIZE + GRID_SIZE // 2
+            apple_pixel_x = COL_PX[self.apple.x] + GRID_SIZE // 2
+            apple_pixel_y = ROW_PX[self.apple.y] + GRID_SIZE // 2
             self.particle_system.add_explosion(apple_pixel_x, apple_pixel_y, 6)
             
             self.spawn_apple()
@@ -345,6 +467,7 @@ class Game:
                 self.spawn_obstacles()
                 # Speed up slightly
                 self.snake.move_delay = max(0.1, self.snake.move_delay - 0.02)
+                self.snake.frames_per_move = round(self.snake.move_delay * FPS)
         
         # Check collisions
         head_x, head_y = head_pos
@@ -353,86 +476,103 @@ class Game:
             self.snake.check_self_collision() or 
             self.is_obstacle(head_x, head_y)):
             self.game_over = True
-            # Add explosion
+            # Add explosion (the head may be off-grid here, so no COL_PX lookup)
             pixel_x = head_x * GRID_SIZE + GRID_SIZE // 2
             pixel_y = head_y * GRID_SIZE + GRID_SIZE // 2
             self.particle_system.add_explosion(pixel_x, pixel_y, 10)
     
     def draw(self):
-        # Simple background
-        self.screen.fill(COLORS['DARK_GREEN'])
-        
-        # Optional grid (can be disabled for better performance)
-        if self.current_fps > 20:  # Only draw grid if FPS is good
-            for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-                pygame.draw.line(self.screen, COLORS['GRID_LINE'], 
-                               (x, 0), (x, WINDOW_HEIGHT), 1)
-            for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-                pygame.draw.line(self.screen, COLORS['GRID_LINE'], 
-                               (0, y), (WINDOW_WIDTH, y), 1)
+        """Draw the frame and return the screen rects that need presenting"""
+        # Background, with the grid only if FPS is good
+        show_grid = self.current_fps > 20
+        if show_grid != self.show_grid:
+            self.show_grid = show_grid
+            self.create_static_background()
+        
+        # Restore only what was drawn over last frame
+        if self.full_redraw:
+            self.screen.blit(self.static_background, (0, 0))
+        else:
+            for rect in self.dirty_rects:
+                self.screen.blit(self.static_background, rect, rect)
         
         # Draw game objects
-        for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
-        
+        rects = []
         if self.apple:
-            self.apple.draw(self.screen)
+            rects.append(self.apple.draw(self.screen, self.apple_sprites))
         
-        self.snake.draw(self.screen)
-        self.particle_system.draw(self.screen)
+        rects.extend(self.snake.draw(self.screen, self.body_tile, self.head_tiles))
+        rects.extend(self.particle_system.draw(self.screen))
         
         # UI
-        self.draw_ui()
+        rects.extend(self.draw_ui())
+        
+        # Present both where things were and where they are now
+        if self.full_redraw:
+            self.full_redraw = False
+            changed = [self.screen.get_rect()]
+        else:
+            changed = self.dirty_rects + rects
+        self.dirty_rects = rects
+        return changed
+    
+    def create_static_texts(self):
+        # Text that never changes is rasterized once
+        self.controls_text = self.font.render("WASD/Arrows:Move P:Pause Q:Quit", 
+                                            True, COLORS['WHITE'])
+        
+        self.pause_text = self.big_font.render("PAUSED", True, COLORS['WHITE'])
+        self.pause_rect = self.pause_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
+        
+        self.game_over_text = self.big_font.render("GAME OVER", True, COLORS['APPLE_RED'])
+        self.restart_text = self.font.render("Press R to restart", True, COLORS['WHITE'])
+        self.game_over_rect = self.game_over_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 30))
+        self.restart_rect = self.restart_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 10))
+    
+    def render_label(self, key, text):
+        # Re-rasterize a HUD label only when its text actually changed
+        cached = self.ui_cache.get(key)
+        if cached is None or cached[0] != text:
+            cached = self.ui_cache[key] = (text, self.font.render(text, True, COLORS['UI_GREEN']))
+        return cached[1]
     
     def draw_ui(self):
         # Compact UI for Pi
-        ui_texts = [
-            f"Score: {self.score}",
-            f"Apples: {self.apples_eaten}",
-            f"FPS: {self.current_fps}"
+        ui_labels = [
+            self.render_label('score', f"Score: {self.score}"),
+            self.render_label('apples', f"Apples: {self.apples_eaten}"),
+            self.render_label('fps', f"FPS: {self.current_fps}")
         ]
         
-        for i, text in enumerate(ui_texts):
-            rendered = self.font.render(text, True, COLORS['UI_GREEN'])
-            self.screen.blit(rendered, (10, 10 + i * 25))
+        rects = []
+        for i, rendered in enumerate(ui_labels):
+            rects.append(self.screen.blit(rendered, (10, 10 + i * 25)))
         
         # Controls hint
-        controls_text = self.font.render("WASD/Arrows:Move P:Pause Q:Quit", 
-                                       True, COLORS['WHITE'])
-        self.screen.blit(controls_text, (10, WINDOW_HEIGHT - 30))
+        rects.append(self.screen.blit(self.controls_text, (10, WINDOW_HEIGHT - 30)))
         
         if self.paused:
-            pause_text = self.big_font.render("PAUSED", True, COLORS['WHITE'])
-            text_rect = pause_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-            self.screen.blit(pause_text, text_rect)
+            rects.append(self.screen.blit(self.pause_text, self.pause_rect))
         
         if self.game_over:
-            game_over_text = self.big_font.render("GAME OVER", True, COLORS['APPLE_RED'])
-            restart_text = self.font.render("Press R to restart", True, COLORS['WHITE'])
-            
-            go_rect = game_over_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 30))
-            r_rect = restart_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 10))
-            
-            self.screen.blit(game_over_text, go_rect)
-            self.screen.blit(restart_text, r_rect)
+            rects.append(self.screen.blit(self.game_over_text, self.game_over_rect))
+            rects.append(self.screen.blit(self.restart_text, self.restart_rect))
+        
+        return rects
     
     def run(self):
         running = True
-        last_time = time.time()
         
         print("Snake Game for Raspberry Pi Zero 2W")
         print("Controls: WASD/Arrow keys to move, P to pause, Q to quit")
         
         while running:
-            current_time = time.time()
-            dt = min(current_time - last_time, 0.05)  # Cap delta time
-            last_time = current_time
+            # Length of the last frame as measured by the clock; capped
+            dt = min(self.clock.get_time() / 1000.0, 0.05)
             
             running = self.handle_events()
             self.update(dt)
-            self.draw()
-            
-            pygame.display.flip()
+            pygame.display.update(self.draw())
             self.clock.tick(FPS)
         
         pygame.quit()
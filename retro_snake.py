@@ -10,9 +10,14 @@ import random
 import math
 import sys
 import time
+import itertools
+import numpy as np
+from collections import Counter, deque
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
+from functools import lru_cache
+from pathlib import Path
 
 # Initialize Pygame
 pygame.init()
@@ -38,6 +43,32 @@ DARK_GRAY = (40, 40, 40)
 LIGHT_GRAY = (128, 128, 128)
 RED = (255, 0, 0)
 
+# Whole-degree trig tables for the rotating power-ups (angles are integers)
+_COS_DEG = tuple(math.cos(math.radians(d)) for d in range(360))
+_SIN_DEG = tuple(math.sin(math.radians(d)) for d in range(360))
+# Food pulse sine lookup: index with int(phase * _SIN_LUT_SCALE) & 1023
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / 1024) for i in range(1024))
+_SIN_LUT_SCALE = 1024 / (2 * math.pi)
+
+@lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface while (font, text, color) repeats"""
+    return font.render(text, True, color)
+
+@lru_cache(maxsize=512)
+def glow_tile(color, alpha, width, height, outline=0):
+    """Build a translucent filled (or outlined) rect surface once per parameter set"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(surface, (*color, alpha), (0, 0, width, height), outline)
+    return surface
+
+@lru_cache(maxsize=2048)
+def particle_sprite(color, size, alpha):
+    """Build a fading particle circle once per (color, radius, alpha)"""
+    surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (size, size), size)
+    return surface
+
 # Game states
 class GameState(Enum):
     MENU = 1
@@ -78,32 +109,93 @@ class Obstacle:
     height: int
     color: Tuple[int, int, int]
     pattern: str
+    cells: List[Tuple[int, int]] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Flatten the covered grid cells once, instead of walking ranges per query"""
+        self.cells = [(self.x + ox, self.y + oy) 
+                      for ox in range(self.width) for oy in range(self.height)]
 
-class Particle:
-    def __init__(self, x, y, color, velocity, lifetime=60):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
+class ParticlePool:
+    """Particles stored as NumPy struct-of-arrays, updated in whole-array steps"""
+    
+    def __init__(self, capacity, rng):
+        self.rng = rng  # The game's Generator, so seeding it covers particle sizes too
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        # Lifetimes (at most 120 frames) and radii (2-5 px) fit in a byte
+        self.life = np.zeros(capacity, dtype=np.uint8)
+        self.max_life = np.ones(capacity, dtype=np.uint8)
+        self.size = np.zeros(capacity, dtype=np.uint8)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.n = 0
+    
+    def __len__(self):
+        return self.n
+    
+    def reserve(self, extra):
+        """Grow the arrays (doubling) so `extra` more particles fit"""
+        needed = self.n + extra
+        capacity = len(self.life)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'size', 'color'):
+            old = getattr(self, name)
+            grown = np.ones((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+    
+    def add(self, x, y, color, velocities, lifetime=60):
+        """Spawn one particle per (vx, vy) in velocities at (x, y); color may be one per particle"""
+        velocities = np.asarray(velocities, dtype=np.float32).reshape(-1, 2)
+        count = len(velocities)
+        self.reserve(count)
+        
+        live = slice(self.n, self.n + count)
+        self.x[live] = x
+        self.y[live] = y
+        self.vx[live] = velocities[:, 0]
+        self.vy[live] = velocities[:, 1]
+        self.life[live] = self.max_life[live] = lifetime
+        self.size[live] = self.rng.integers(2, 6, count)
+        self.color[live] = color
+        self.n += count
     
     def update(self):
-        self.x += self.velocity[0]
-        self.y += self.velocity[1]
-        self.lifetime -= 1
-        self.velocity = (self.velocity[0] * 0.98, self.velocity[1] * 0.98)
+        """Move, age and damp every particle, then drop the expired ones"""
+        n = self.n
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+        self.vx[:n] *= 0.98
+        self.vy[:n] *= 0.98
+        
+        alive = self.life[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.size, self.color):
+                arr[:live] = arr[:n][alive]
+            self.n = live
     
     def draw(self, screen):
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color_with_alpha = (*self.color, alpha)
-        s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s, color_with_alpha, (self.size, self.size), self.size)
-        screen.blit(s, (self.x - self.size, self.y - self.size))
+        """Draw every particle as a fading circle; returns the rects touched"""
+        n = self.n
+        blit_list = []
+        for x, y, size, life, max_life, color in zip(self.x[:n].tolist(), self.y[:n].tolist(), 
+                                                     self.size[:n].tolist(), self.life[:n].tolist(), 
+                                                     self.max_life[:n].tolist(), self.color[:n].tolist()):
+            alpha = int(255 * (life / max_life))
+            blit_list.append((particle_sprite(tuple(color), size, alpha), (x - size, y - size)))
+        return screen.blits(blit_list)
 
 class SnakeGame:
     def __init__(self):
+        global WINDOW_WIDTH, WINDOW_HEIGHT, GRID_WIDTH, GRID_HEIGHT
+        
         # Initialize display with Pi-friendly settings
         try:
             # Try fullscreen first for Pi
@@ -113,24 +205,48 @@ class SnakeGame:
         except pygame.error as e:
             print(f"Display error: {e}")
             # Fallback to smaller resolution
-            global WINDOW_WIDTH, WINDOW_HEIGHT, GRID_WIDTH, GRID_HEIGHT
             WINDOW_WIDTH, WINDOW_HEIGHT = 640, 480
             GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
             GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
             self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
             print(f"Fallback display: {WINDOW_WIDTH}x{WINDOW_HEIGHT}")
+        self.display = self.screen
+        # Only QUIT and KEYDOWN are handled; SDL drops the rest (mouse motion etc.)
+        # before they reach Python. Held keys are polled, which needs no events.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        self.shake_frame = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
         self.clock = pygame.time.Clock()
         self.font_small = pygame.font.Font(None, 24)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_large = pygame.font.Font(None, 48)
         self.font_title = pygame.font.Font(None, 72)
+        self.obstacle_tiles = {}  # color -> pre-rendered cell with glow
+        self.food_sprites = {}  # pulse level -> pre-rendered food with glow
         
         self.reset_game()
         self.state = GameState.MENU
-        self.particles = []
+        self.perf = PerformanceManager()
+        self.rng = np.random.default_rng()
+        self.particles = ParticlePool(self.perf.particle_limit, self.rng)
         self.screen_shake = 0
         self.background_pattern = self.create_background_pattern()
-        
+        # Semi-transparent pause overlay, in display format for the fast alpha blit
+        self.pause_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.pause_overlay.fill(BLACK)
+        self.pause_overlay.set_alpha(128)
+        self.snake_tiles = {invincible: self.create_snake_tiles(invincible) 
+                            for invincible in (False, True)}
+        self.sample_time()
+        self.title_surface, self.title_rect = self.create_title_surface()
+        self.menu_text_surface, self.menu_text_rect = self.create_menu_text_surface()
+        
+    def sample_time(self):
+        """Read the clock once per frame; every timer and blink phase derives from it"""
+        self.now = time.time()
+        self.blink_slow = int(self.now * 3) % 2 == 0  # Menu and game over prompts
+        self.blink_fast = int(self.now * 10) % 2 == 0  # Expiring power-ups
+    
     def create_background_pattern(self):
         """Create a retro grid background pattern"""
         pattern = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
@@ -144,11 +260,73 @@ class SnakeGame:
             
         return pattern
     
+    def create_obstacle_tile(self, color):
+        """Pre-render one obstacle cell, glow included, offset by 1px for the glow"""
+        tile = pygame.Surface((GRID_SIZE + 2, GRID_SIZE + 2)).convert()
+        # The glow is drawn opaque, as pygame ignores alpha on the display surface
+        tile.fill(color)
+        rect = pygame.Rect(1, 1, GRID_SIZE, GRID_SIZE)
+        pygame.draw.rect(tile, WHITE, rect, 1)
+        return tile
+    
+    def create_food_sprite(self, pulse):
+        """Pre-render the food at one pulse level, with its 3px glow"""
+        color = (255, pulse, pulse)
+        sprite = pygame.Surface((GRID_SIZE + 6, GRID_SIZE + 6)).convert()
+        # Glow and body share the color, as the glow's alpha is ignored on the display
+        sprite.fill(color)
+        pygame.draw.rect(sprite, WHITE, (3, 3, GRID_SIZE, GRID_SIZE), 2)
+        return sprite
+    
+    def create_snake_tiles(self, invincible):
+        """Pre-render the head (with 2px glow border) and every body gradient step"""
+        color = NEON_GREEN if not invincible else NEON_PURPLE
+        head = pygame.Surface((GRID_SIZE + 4, GRID_SIZE + 4)).convert()
+        head.fill(color)
+        pygame.draw.rect(head, WHITE, (2, 2, GRID_SIZE, GRID_SIZE), 1)
+        tiles = [head]
+        
+        # Gradient from head to tail; bottoms out at intensity 50 from index 21
+        for i in range(1, 22):
+            intensity = max(50, 255 - i * 10)
+            color = (0, intensity, 0) if not invincible else (intensity, 0, intensity)
+            body = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+            body.fill(color)
+            pygame.draw.rect(body, WHITE, body.get_rect(), 1)
+            tiles.append(body)
+        return tiles
+    
+    def create_title_surface(self):
+        """Pre-render the menu title with its four glow copies"""
+        title_text = self.font_title.render("RETRO SNAKE", True, NEON_GREEN)
+        glow_text = self.font_title.render("RETRO SNAKE", True, (0, 100, 0))
+        surface = pygame.Surface((title_text.get_width() + 4, title_text.get_height() + 4), 
+                                 pygame.SRCALPHA).convert_alpha()
+        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
+            surface.blit(glow_text, (2 + offset[0], 2 + offset[1]))
+        surface.blit(title_text, (2, 2))
+        rect = surface.get_rect(center=(WINDOW_WIDTH // 2, 150))
+        return surface, rect
+    
+    def create_menu_text_surface(self):
+        """Pre-render the static menu instruction lines into one surface"""
+        lines = [self.font_medium.render(text, True, NEON_CYAN) for text in 
+                 ("Use Arrow Keys to Move", "Collect Food and Power-ups", "Avoid Obstacles and Yourself")]
+        width = max(line.get_width() for line in lines)
+        surface = pygame.Surface((width, 70 + lines[-1].get_height()), 
+                                 pygame.SRCALPHA).convert_alpha()
+        for i, line in enumerate(lines):
+            surface.blit(line, (width // 2 - line.get_width() // 2, i * 35))
+        # Line centers sit at 250, 285 and 320 on screen, as when drawn one by one
+        rect = surface.get_rect(centerx=WINDOW_WIDTH // 2, top=250 - lines[0].get_height() // 2)
+        return surface, rect
+    
     def reset_game(self):
         """Reset game to initial state"""
-        self.snake = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
+        self.snake = deque([(GRID_WIDTH // 2, GRID_HEIGHT // 2)])
+        # Cell -> number of segments on it (grow and invincibility can stack them)
+        self.snake_cells = Counter(self.snake)
         self.direction = Direction.RIGHT
-        self.food = self.spawn_food()
         self.score = 0
         self.high_score = self.load_high_score()
         self.speed = 8
@@ -163,6 +341,7 @@ class SnakeGame:
         self.level = 1
         
         self.generate_obstacles()
+        self.food = self.spawn_food()  # After obstacles, which it must avoid
         
     def load_high_score(self):
         """Load high score from file"""
@@ -187,7 +366,7 @@ class SnakeGame:
             y = random.randint(0, GRID_HEIGHT - 1)
             
             # Check if position is free
-            if (x, y) not in self.snake and not self.is_obstacle_at(x, y):
+            if (x, y) not in self.snake_cells and not self.is_obstacle_at(x, y):
                 return (x, y)
     
     def spawn_power_up(self):
@@ -210,19 +389,38 @@ class SnakeGame:
             x = random.randint(0, GRID_WIDTH - 1)
             y = random.randint(0, GRID_HEIGHT - 1)
             
-            if (x, y) not in self.snake and (x, y) != self.food and not self.is_obstacle_at(x, y):
-                power_up = PowerUp(x, y, power_type, 300, color, time.time())
+            if (x, y) not in self.snake_cells and (x, y) != self.food and not self.is_obstacle_at(x, y):
+                power_up = PowerUp(x, y, power_type, 300, color, self.now)
                 self.power_ups.append(power_up)
                 break
     
     def generate_obstacles(self):
         """Generate obstacles based on current level"""
         self.obstacles.clear()
+        self.full_redraw = True  # Obstacles are only presented by full updates
         
         obstacle_count = min(3 + self.level // 2, 8)
         
         for _ in range(obstacle_count):
             self.create_random_obstacle()
+        
+        self.obstacle_cells = {cell for obstacle in self.obstacles for cell in obstacle.cells}
+        self.obstacle_layer = self.create_obstacle_layer()
+    
+    def create_obstacle_layer(self):
+        """Render every obstacle cell into one window-sized, black-keyed surface"""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        layer.fill(BLACK)
+        blit_list = []
+        for obstacle in self.obstacles:
+            tile = self.obstacle_tiles.get(obstacle.color)
+            if tile is None:
+                tile = self.obstacle_tiles[obstacle.color] = self.create_obstacle_tile(obstacle.color)
+            blit_list.extend((tile, (x * GRID_SIZE - 1, y * GRID_SIZE - 1)) for x, y in obstacle.cells)
+        layer.blits(blit_list, doreturn=False)
+        # No obstacle color is black, so the key only drops the empty space; RLE skips it fast
+        layer.set_colorkey(BLACK, pygame.RLEACCEL)
+        return layer
     
     def create_random_obstacle(self):
         """Create a random obstacle pattern"""
@@ -276,11 +474,7 @@ class SnakeGame:
     
     def is_obstacle_at(self, x, y):
         """Check if there's an obstacle at given position"""
-        for obstacle in self.obstacles:
-            if (obstacle.x <= x < obstacle.x + obstacle.width and 
-                obstacle.y <= y < obstacle.y + obstacle.height):
-                return True
-        return False
+        return (x, y) in self.obstacle_cells
     
     def handle_input(self):
         """Handle keyboard input"""
@@ -326,9 +520,8 @@ class SnakeGame:
             self.spawn_power_up()
         
         # Remove expired power-ups
-        current_time = time.time()
         self.power_ups = [p for p in self.power_ups 
-                         if current_time - p.spawn_time < 10]
+                         if self.now - p.spawn_time < 10]
         
         # Move snake
         head_x, head_y = self.snake[0]
@@ -341,7 +534,8 @@ class SnakeGame:
                 self.game_over()
                 return
         
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self.snake_cells[new_head] += 1
         
         # Check food collision
         if new_head == self.food:
@@ -358,7 +552,7 @@ class SnakeGame:
             if self.score // 100 > self.level - 1:
                 self.level_up()
         else:
-            self.snake.pop()
+            self.pop_tail()
         
         # Check power-up collision
         for power_up in self.power_ups[:]:
@@ -376,7 +570,7 @@ class SnakeGame:
             return True
         
         # Self collision
-        if pos in self.snake:
+        if pos in self.snake_cells:
             return True
         
         # Obstacle collision
@@ -385,6 +579,13 @@ class SnakeGame:
         
         return False
     
+    def pop_tail(self):
+        """Remove the last snake segment, keeping the cell counts in step"""
+        tail = self.snake.pop()
+        self.snake_cells[tail] -= 1
+        if not self.snake_cells[tail]:
+            del self.snake_cells[tail]
+    
     def apply_power_up(self, power_up):
         """Apply power-up effect"""
         effect_duration = 300  # frames
@@ -402,11 +603,12 @@ class SnakeGame:
                 if self.snake:
                     tail = self.snake[-1]
                     self.snake.append(tail)
+                    self.snake_cells[tail] += 1
         
         elif power_up.type == PowerUpType.SHRINK:
             if len(self.snake) > 3:
                 for _ in range(min(2, len(self.snake) - 1)):
-                    self.snake.pop()
+                    self.pop_tail()
         
         elif power_up.type == PowerUpType.INVINCIBILITY:
             self.invincible = True
@@ -446,29 +648,26 @@ class SnakeGame:
         self.screen_shake = 10
         
         # Create celebration particles
-        for _ in range(20):
-            self.create_random_particle((WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+        self.create_random_particles((WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2), 
+                                     self.perf.scaled_count(20, len(self.particles)))
     
     def create_food_particles(self, pos):
         """Create particles when food is eaten"""
         x, y = pos[0] * GRID_SIZE + GRID_SIZE // 2, pos[1] * GRID_SIZE + GRID_SIZE // 2
-        for _ in range(8):
-            velocity = (random.uniform(-3, 3), random.uniform(-3, 3))
-            self.particles.append(Particle(x, y, NEON_GREEN, velocity))
+        velocities = self.rng.uniform(-3, 3, (self.perf.scaled_count(8, len(self.particles)), 2))
+        self.particles.add(x, y, NEON_GREEN, velocities)
     
     def create_power_up_particles(self, pos, color):
         """Create particles when power-up is collected"""
         x, y = pos[0] * GRID_SIZE + GRID_SIZE // 2, pos[1] * GRID_SIZE + GRID_SIZE // 2
-        for _ in range(12):
-            velocity = (random.uniform(-4, 4), random.uniform(-4, 4))
-            self.particles.append(Particle(x, y, color, velocity))
+        velocities = self.rng.uniform(-4, 4, (self.perf.scaled_count(12, len(self.particles)), 2))
+        self.particles.add(x, y, color, velocities)
     
-    def create_random_particle(self, pos):
-        """Create a random colored particle"""
-        colors = [NEON_GREEN, NEON_PINK, NEON_BLUE, NEON_YELLOW, NEON_ORANGE]
-        color = random.choice(colors)
-        velocity = (random.uniform(-5, 5), random.uniform(-5, 5))
-        self.particles.append(Particle(pos[0], pos[1], color, velocity))
+    def create_random_particles(self, pos, count=1):
+        """Create randomly colored particles"""
+        colors = np.array([NEON_GREEN, NEON_PINK, NEON_BLUE, NEON_YELLOW, NEON_ORANGE], dtype=np.uint8)
+        velocities = self.rng.uniform(-5, 5, (count, 2))
+        self.particles.add(pos[0], pos[1], colors[self.rng.integers(0, len(colors), count)], velocities)
     
     def game_over(self):
         """Handle game over"""
@@ -480,54 +679,43 @@ class SnakeGame:
         # Create explosion particles
         head = self.snake[0]
         x, y = head[0] * GRID_SIZE + GRID_SIZE // 2, head[1] * GRID_SIZE + GRID_SIZE // 2
-        for _ in range(30):
-            velocity = (random.uniform(-6, 6), random.uniform(-6, 6))
-            self.particles.append(Particle(x, y, RED, velocity, 120))
+        velocities = self.rng.uniform(-6, 6, (self.perf.scaled_count(30, len(self.particles)), 2))
+        self.particles.add(x, y, RED, velocities, 120)
     
     def draw_snake(self):
         """Draw the snake with gradient effect"""
+        tiles = self.snake_tiles[self.invincible]
+        head_x, head_y = self.snake[0]
+        # Head with glowing border, then the body gradient in one batch
+        blit_list = [(tiles[0], (head_x * GRID_SIZE - 2, head_y * GRID_SIZE - 2))]
         for i, (x, y) in enumerate(self.snake):
-            rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            
-            if i == 0:  # Head
-                color = NEON_GREEN if not self.invincible else NEON_PURPLE
-                # Add glowing effect for head
-                glow_rect = rect.inflate(4, 4)
-                pygame.draw.rect(self.screen, (*color, 100), glow_rect)
-            else:  # Body
-                # Gradient from head to tail
-                intensity = max(50, 255 - i * 10)
-                color = (0, intensity, 0) if not self.invincible else (intensity, 0, intensity)
-            
-            pygame.draw.rect(self.screen, color, rect)
-            pygame.draw.rect(self.screen, WHITE, rect, 1)
+            if i:
+                blit_list.append((tiles[min(i, 21)], (x * GRID_SIZE, y * GRID_SIZE)))
+        return self.screen.blits(blit_list)
     
     def draw_food(self):
         """Draw food with pulsing effect"""
         x, y = self.food
-        rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
         
-        # Pulsing effect
-        pulse = int(128 + 127 * math.sin(self.game_time * 0.3))
-        color = (255, pulse, pulse)
-        
-        # Glow effect
-        glow_rect = rect.inflate(6, 6)
-        pygame.draw.rect(self.screen, (*color, 80), glow_rect)
-        pygame.draw.rect(self.screen, color, rect)
-        pygame.draw.rect(self.screen, WHITE, rect, 2)
+        # Pulsing effect, one cached sprite per pulse level
+        pulse = int(128 + 127 * _SIN_LUT[int(self.game_time * 0.3 * _SIN_LUT_SCALE) & 1023])
+        sprite = self.food_sprites.get(pulse)
+        if sprite is None:
+            sprite = self.food_sprites[pulse] = self.create_food_sprite(pulse)
+        return [self.screen.blit(sprite, (x * GRID_SIZE - 3, y * GRID_SIZE - 3))]
     
     def draw_power_ups(self):
         """Draw power-ups with special effects"""
-        current_time = time.time()
+        rects = []
         
         for power_up in self.power_ups:
             x, y = power_up.x * GRID_SIZE, power_up.y * GRID_SIZE
             rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
+            rects.append(rect)  # Blinked-out frames still need presenting
             
             # Blinking effect when about to expire
-            time_left = 10 - (current_time - power_up.spawn_time)
-            if time_left < 3 and int(current_time * 10) % 2:
+            time_left = 10 - (self.now - power_up.spawn_time)
+            if time_left < 3 and not self.blink_fast:
                 continue
             
             # Rotating effect
@@ -537,166 +725,134 @@ class SnakeGame:
             center = rect.center
             points = []
             for i in range(4):
-                px = center[0] + (GRID_SIZE // 3) * math.cos(math.radians(angle + i * 90))
-                py = center[1] + (GRID_SIZE // 3) * math.sin(math.radians(angle + i * 90))
+                a = (angle + i * 90) % 360
+                px = center[0] + (GRID_SIZE // 3) * _COS_DEG[a]
+                py = center[1] + (GRID_SIZE // 3) * _SIN_DEG[a]
                 points.append((px, py))
             
             pygame.draw.polygon(self.screen, power_up.color, points)
             pygame.draw.polygon(self.screen, WHITE, points, 2)
+        
+        return rects
     
     def draw_obstacles(self):
         """Draw obstacles with neon effects"""
-        for obstacle in self.obstacles:
-            for ox in range(obstacle.width):
-                for oy in range(obstacle.height):
-                    x = (obstacle.x + ox) * GRID_SIZE
-                    y = (obstacle.y + oy) * GRID_SIZE
-                    rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
-                    
-                    # Glow effect
-                    glow_rect = rect.inflate(2, 2)
-                    pygame.draw.rect(self.screen, (*obstacle.color, 100), glow_rect)
-                    pygame.draw.rect(self.screen, obstacle.color, rect)
-                    pygame.draw.rect(self.screen, WHITE, rect, 1)
+        # Pre-rendered in generate_obstacles, as obstacles only change per level
+        self.screen.blit(self.obstacle_layer, (0, 0))
     
     def draw_hud(self):
-        """Draw heads-up display"""
+        """Draw heads-up display; returns the rects touched"""
+        rects = []
+        
         # Score
-        score_text = self.font_medium.render(f"Score: {self.score}", True, NEON_GREEN)
-        self.screen.blit(score_text, (10, 10))
+        score_text = render_text(self.font_medium, f"Score: {self.score}", NEON_GREEN)
+        rects.append(self.screen.blit(score_text, (10, 10)))
         
         # High Score
-        high_score_text = self.font_small.render(f"High: {self.high_score}", True, NEON_YELLOW)
-        self.screen.blit(high_score_text, (10, 45))
+        high_score_text = render_text(self.font_small, f"High: {self.high_score}", NEON_YELLOW)
+        rects.append(self.screen.blit(high_score_text, (10, 45)))
         
         # Level
-        level_text = self.font_small.render(f"Level: {self.level}", True, NEON_BLUE)
-        self.screen.blit(level_text, (10, 70))
+        level_text = render_text(self.font_small, f"Level: {self.level}", NEON_BLUE)
+        rects.append(self.screen.blit(level_text, (10, 70)))
         
         # Speed
-        speed_text = self.font_small.render(f"Speed: {self.speed}", True, NEON_CYAN)
-        self.screen.blit(speed_text, (10, 95))
+        speed_text = render_text(self.font_small, f"Speed: {self.speed}", NEON_CYAN)
+        rects.append(self.screen.blit(speed_text, (10, 95)))
         
         # Active effects
         y_offset = 120
         for effect, timer in self.effect_timers.items():
             effect_name = effect.replace('_', ' ').title()
             color = NEON_PURPLE if effect == 'invincibility' else NEON_ORANGE
-            effect_text = self.font_small.render(f"{effect_name}: {timer//60}s", True, color)
-            self.screen.blit(effect_text, (10, y_offset))
+            effect_text = render_text(self.font_small, f"{effect_name}: {timer//60}s", color)
+            rects.append(self.screen.blit(effect_text, (10, y_offset)))
             y_offset += 25
+        
+        return rects
     
     def draw_menu(self):
         """Draw main menu"""
-        # Title with glow effect
-        title_text = self.font_title.render("RETRO SNAKE", True, NEON_GREEN)
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
+        # Title with glow effect, and the static instructions, are pre-rendered
+        self.screen.blit(self.title_surface, self.title_rect)
+        self.screen.blit(self.menu_text_surface, self.menu_text_rect)
         
-        # Glow effect
-        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            glow_text = self.font_title.render("RETRO SNAKE", True, (0, 100, 0))
-            glow_rect = title_rect.copy()
-            glow_rect.move_ip(offset)
-            self.screen.blit(glow_text, glow_rect)
-        
-        self.screen.blit(title_text, title_rect)
-        
-        # Instructions
-        instructions = [
-            "Use Arrow Keys to Move",
-            "Collect Food and Power-ups",
-            "Avoid Obstacles and Yourself",
-            "",
-            f"High Score: {self.high_score}",
-            "",
-            "Press SPACE to Start"
-        ]
+        high_score_text = render_text(self.font_medium, f"High Score: {self.high_score}", NEON_YELLOW)
+        self.screen.blit(high_score_text, high_score_text.get_rect(center=(WINDOW_WIDTH // 2, 390)))
         
-        y_offset = 250
-        for instruction in instructions:
-            if instruction:
-                color = NEON_YELLOW if "High Score" in instruction else NEON_CYAN
-                if "Press SPACE" in instruction:
-                    color = NEON_PINK
-                    # Blinking effect
-                    if int(time.time() * 3) % 2 == 0:
-                        color = WHITE
-                
-                text = self.font_medium.render(instruction, True, color)
-                text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
-                self.screen.blit(text, text_rect)
-            
-            y_offset += 35
+        # Blinking effect
+        color = WHITE if self.blink_slow else NEON_PINK
+        start_text = render_text(self.font_medium, "Press SPACE to Start", color)
+        self.screen.blit(start_text, start_text.get_rect(center=(WINDOW_WIDTH // 2, 460)))
     
     def draw_game_over(self):
-        """Draw game over screen"""
+        """Draw game over screen; returns the rects that can change"""
         # Game Over text
-        game_over_text = self.font_large.render("GAME OVER", True, RED)
+        game_over_text = render_text(self.font_large, "GAME OVER", RED)
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Final score
-        score_text = self.font_medium.render(f"Final Score: {self.score}", True, NEON_GREEN)
+        score_text = render_text(self.font_medium, f"Final Score: {self.score}", NEON_GREEN)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, 280))
         self.screen.blit(score_text, score_rect)
         
         # High score
         if self.score == self.high_score and self.score > 0:
-            new_high_text = self.font_medium.render("NEW HIGH SCORE!", True, NEON_YELLOW)
+            new_high_text = render_text(self.font_medium, "NEW HIGH SCORE!", NEON_YELLOW)
             new_high_rect = new_high_text.get_rect(center=(WINDOW_WIDTH // 2, 320))
             self.screen.blit(new_high_text, new_high_rect)
         
         # Continue instruction
-        continue_text = self.font_medium.render("Press SPACE to Continue", True, NEON_PINK)
+        continue_text = render_text(self.font_medium, "Press SPACE to Continue", NEON_PINK)
         continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, 400))
         
         # Blinking effect
-        if int(time.time() * 3) % 2 == 0:
+        if self.blink_slow:
             self.screen.blit(continue_text, continue_rect)
+        
+        return [score_rect, continue_rect]
     
     def draw_pause_screen(self):
         """Draw pause screen overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.pause_overlay, (0, 0))
         
         # Pause text
-        pause_text = self.font_large.render("PAUSED", True, NEON_YELLOW)
+        pause_text = render_text(self.font_large, "PAUSED", NEON_YELLOW)
         pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
         self.screen.blit(pause_text, pause_rect)
         
         # Continue instruction
-        continue_text = self.font_medium.render("Press SPACE to Continue", True, NEON_CYAN)
+        continue_text = render_text(self.font_medium, "Press SPACE to Continue", NEON_CYAN)
         continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
         self.screen.blit(continue_text, continue_rect)
     
     def update_particles(self):
         """Update and remove expired particles"""
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
     
     def draw_particles(self):
         """Draw all particles"""
-        for particle in self.particles:
-            particle.draw(self.screen)
+        return self.particles.draw(self.screen)
     
     def apply_screen_shake(self):
-        """Apply screen shake effect"""
+        """Apply screen shake effect by presenting the off-screen frame at an offset"""
         if self.screen_shake > 0:
             shake_x = random.randint(-self.screen_shake, self.screen_shake)
             shake_y = random.randint(-self.screen_shake, self.screen_shake)
-            self.screen.scroll(shake_x, shake_y)
+            self.display.blit(self.shake_frame, (shake_x, shake_y))
             self.screen_shake -= 1
     
     def run(self):
         """Main game loop"""
         running = True
+        last_state = None
+        prev_dirty = []  # Rects drawn last frame; presented again to erase them
         
         while running:
+            self.sample_time()
+            
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -717,15 +873,20 @@ class SnakeGame:
             self.update_game()
             self.update_particles()
             
-            # Draw everything
+            # While shaking, draw off-screen so the frame is only moved once, when presented
+            shaking = self.screen_shake > 0
+            self.screen = self.shake_frame if shaking else self.display
+            
+            # Draw everything, collecting the rects that can differ from last frame
             self.screen.blit(self.background_pattern, (0, 0))
+            dirty = []
             
             if self.state == GameState.PLAYING:
                 self.draw_obstacles()
-                self.draw_food()
-                self.draw_power_ups()
-                self.draw_snake()
-                self.draw_hud()
+                dirty += self.draw_food()
+                dirty += self.draw_power_ups()
+                dirty += self.draw_snake()
+                dirty += self.draw_hud()
                 
             elif self.state == GameState.MENU:
                 self.draw_menu()
@@ -733,26 +894,39 @@ class SnakeGame:
             elif self.state == GameState.GAME_OVER:
                 # Still show game elements in background
                 self.draw_obstacles()
-                self.draw_snake()
-                self.draw_game_over()
+                dirty += self.draw_snake()
+                dirty += self.draw_game_over()
                 
             elif self.state == GameState.PAUSED:
                 self.draw_obstacles()
-                self.draw_food()
-                self.draw_power_ups()
-                self.draw_snake()
-                self.draw_hud()
+                dirty += self.draw_food()
+                dirty += self.draw_power_ups()
+                dirty += self.draw_snake()
+                dirty += self.draw_hud()
                 self.draw_pause_screen()
             
             # Always draw particles on top
-            self.draw_particles()
+            dirty += self.draw_particles()
             
             # Apply screen effects
             self.apply_screen_shake()
             
-            # Update display
-            pygame.display.flip()
+            # Update display: the whole screen when all of it may have moved
+            # (menu, state change, shake, new obstacles), else just the dirty rects
+            changed = prev_dirty + dirty
+            if (self.full_redraw or shaking or self.state == GameState.MENU or 
+                self.state != last_state or 
+                sum(r.width * r.height for r in changed) > WINDOW_WIDTH * WINDOW_HEIGHT // 2):
+                pygame.display.flip()
+            else:
+                pygame.display.update(changed)
+            # The frame after a shake must also be full, to drop the offset
+            self.full_redraw = shaking
+            last_state = self.state
+            prev_dirty = dirty
             self.clock.tick(self.speed if self.state == GameState.PLAYING else 60)
+            # Work time only: the low game speeds would otherwise always look over budget
+            self.perf.update_frame_time(self.clock.get_rawtime())
         
         pygame.quit()
         sys.exit()
@@ -766,9 +940,8 @@ class GameEffects:
         """Create a trailing effect for moving objects"""
         for i, pos in enumerate(positions):
             alpha = max_alpha * (i + 1) / len(positions)
-            trail_surface = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
-            trail_color = (*color, int(alpha))
-            pygame.draw.rect(trail_surface, trail_color, (0, 0, GRID_SIZE, GRID_SIZE))
+            # Alpha rounded down to a multiple of 8 keeps the tile cache small
+            trail_surface = glow_tile(tuple(color), int(alpha) & ~7, GRID_SIZE, GRID_SIZE)
             screen.blit(trail_surface, (pos[0] * GRID_SIZE, pos[1] * GRID_SIZE))
     
     @staticmethod
@@ -778,8 +951,7 @@ class GameEffects:
         for i in range(thickness * 2):
             glow_rect = rect.inflate(i * 2, i * 2)
             glow_alpha = max(10, 100 - i * 15)
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*color, glow_alpha), glow_surface.get_rect(), 1)
+            glow_surface = glow_tile(tuple(color), glow_alpha, glow_rect.width, glow_rect.height, 1)
             screen.blit(glow_surface, glow_rect.topleft)
         
         # Main border
@@ -810,30 +982,76 @@ class AIPlayer:
     
     def __init__(self, game):
         self.game = game
+        # Reused BFS buffers over the grid, indexed by y * GRID_WIDTH + x
+        self.cell_count = GRID_WIDTH * GRID_HEIGHT
+        self.blocked = bytearray(self.cell_count)
+        self.parent = [-1] * self.cell_count
+        self.queue = deque()
         
     def get_next_move(self):
-        """Calculate the next optimal move"""
+        """Calculate the next optimal move: first step of a shortest path to the food"""
         if not self.game.snake:
             return Direction.RIGHT
             
         head = self.game.snake[0]
         food = self.game.food
         
-        # Simple pathfinding toward food
-        dx = food[0] - head[0]
-        dy = food[1] - head[1]
-        
-        # Prioritize the direction with larger distance
-        if abs(dx) > abs(dy):
-            if dx > 0:
-                return Direction.RIGHT
-            else:
-                return Direction.LEFT
-        else:
-            if dy > 0:
-                return Direction.DOWN
-            else:
-                return Direction.UP
+        # An invincible snake can leave the grid, where the flat BFS indices
+        # would wrap or overflow; steer straight back toward the grid instead
+        if head[0] < 0:
+            return Direction.RIGHT
+        if head[0] >= GRID_WIDTH:
+            return Direction.LEFT
+        if head[1] < 0:
+            return Direction.DOWN
+        if head[1] >= GRID_HEIGHT:
+            return Direction.UP
+        
+        # Mark snake and obstacle cells as walls
+        blocked = self.blocked
+        blocked[:] = bytes(self.cell_count)
+        for x, y in itertools.chain(self.game.snake_cells, self.game.obstacle_cells):
+            if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
+                blocked[y * GRID_WIDTH + x] = 1
+        
+        # Breadth-first search from the head; parent doubles as the visited set
+        parent = self.parent
+        parent[:] = [-1] * self.cell_count
+        start = head[1] * GRID_WIDTH + head[0]  # In range, as the head is on the grid
+        goal = food[1] * GRID_WIDTH + food[0]
+        parent[start] = start
+        queue = self.queue
+        queue.clear()
+        queue.append(start)
+        while queue:
+            cell = queue.popleft()
+            if cell == goal:
+                break
+            x, y = cell % GRID_WIDTH, cell // GRID_WIDTH
+            for direction in Direction:
+                dx, dy = direction.value
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
+                    nxt = ny * GRID_WIDTH + nx
+                    if parent[nxt] < 0 and not blocked[nxt]:
+                        parent[nxt] = cell
+                        queue.append(nxt)
+        
+        if parent[goal] >= 0 and goal != start:
+            # Walk back from the food to the cell right after the head
+            cell = goal
+            while parent[cell] != start:
+                cell = parent[cell]
+            step = (cell % GRID_WIDTH - head[0], cell // GRID_WIDTH - head[1])
+            return Direction(step)
+        
+        # Food unreachable: take any free neighbor, else keep going
+        for direction in Direction:
+            dx, dy = direction.value
+            nx, ny = head[0] + dx, head[1] + dy
+            if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT and not blocked[ny * GRID_WIDTH + nx]:
+                return direction
+        return self.game.direction
 
 class GameStats:
     """Track detailed game statistics"""
@@ -919,28 +1137,35 @@ class GameConfig:
         self.particle_effects = True
         self.screen_shake = True
         self.auto_pause_on_focus_loss = True
+        self.loaded_digest = None  # Hash of the config text last parsed
         
     def load_from_file(self, filename='snake_config.txt'):
         """Load configuration from file"""
         try:
-            with open(filename, 'r') as f:
-                # Simple key=value format
-                for line in f:
-                    if '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        if hasattr(self, key):
-                            setattr(self, key, value)
+            data = Path(filename).read_text()
         except FileNotFoundError:
-            pass
+            return
+        
+        # Skip re-parsing when the file has not changed since the last load
+        digest = hash(data)
+        if digest == self.loaded_digest:
+            return
+        self.loaded_digest = digest
+        
+        # Simple key=value format
+        for line in data.splitlines():
+            key, sep, value = line.strip().partition('=')
+            if sep and hasattr(self, key):
+                setattr(self, key, value)
     
     def save_to_file(self, filename='snake_config.txt'):
         """Save configuration to file"""
         try:
-            with open(filename, 'w') as f:
-                f.write(f"difficulty={self.difficulty}\n")
-                f.write(f"show_grid={self.show_grid}\n")
-                f.write(f"particle_effects={self.particle_effects}\n")
-                f.write(f"screen_shake={self.screen_shake}\n")
+            # One buffered write for the whole file
+            Path(filename).write_text(f"difficulty={self.difficulty}\n"
+                                      f"show_grid={self.show_grid}\n"
+                                      f"particle_effects={self.particle_effects}\n"
+                                      f"screen_shake={self.screen_shake}\n")
         except:
             pass
 
@@ -952,7 +1177,7 @@ class PerformanceManager:
         self.target_fps = 60
         self.particle_limit = 50
         self.auto_reduce_effects = True
-        self.frame_times = []
+        self.frame_times = deque(maxlen=30)
         
     def should_reduce_effects(self):
         """Check if effects should be reduced for performance"""
@@ -964,9 +1189,14 @@ class PerformanceManager:
     
     def update_frame_time(self, frame_time):
         """Update frame time tracking"""
-        self.frame_times.append(frame_time)
-        if len(self.frame_times) > 30:
-            self.frame_times.pop(0)
+        self.frame_times.append(frame_time)  # The deque drops the oldest past 30
+    
+    def scaled_count(self, count, active=0):
+        """Particles to spawn for a burst of `count`: halved, and capped at
+        particle_limit in total, while frames run over budget"""
+        if not (self.auto_reduce_effects and self.should_reduce_effects()):
+            return count
+        return max(0, min(count // 2, self.particle_limit - active))
 
 # Main execution
 if __name__ == "__main__":
@@ -10,9 +10,12 @@ import random
 import math
 import sys
 import time
+import numpy as np
+from collections import Counter, deque
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
+from functools import lru_cache
 
 # Initialize Pygame
 pygame.init()
@@ -23,6 +26,10 @@ WINDOW_HEIGHT = 600
 GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
+ALL_CELLS = [(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)]
+# Repaint and present only the areas sprites touched, instead of the whole screen;
+# the background is static, so this is much less pixel traffic on the Pi
+USE_DIRTY_RECTS = True
 
 # Colors - Retro neon palette
 BLACK = (0, 0, 0)
@@ -38,19 +45,44 @@ DARK_GRAY = (40, 40, 40)
 LIGHT_GRAY = (128, 128, 128)
 RED = (255, 0, 0)
 
-# Game states
-class GameState(Enum):
+# Rotating power-up corners, pre-scaled: the angle steps 5 degrees per frame,
+# so there are only 72 distinct states, baked into per-color flipbooks
+_ROTATION_OFFSETS = tuple(
+    tuple(((GRID_SIZE // 3) * math.cos(math.radians(a + i * 90)), 
+           (GRID_SIZE // 3) * math.sin(math.radians(a + i * 90))) for i in range(4))
+    for a in range(0, 360, 5))
+
+@lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Render antialiased text once per (font, text, color), in display format"""
+    return font.render(text, True, color).convert_alpha()
+
+# Game states and directions are plain ints: the tick compares and indexes them
+# every frame, and Enum members are costly to hash and compare
+class GameState:
     MENU = 1
     PLAYING = 2
     PAUSED = 3
     GAME_OVER = 4
 
 # Directions
-class Direction(Enum):
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+class Direction:
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+# Grid step for each direction, indexed by the Direction int
+_DIR_VEC = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Arrow keys and the move each one asks for
+DIRECTION_KEYS = {
+    pygame.K_UP: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN,
+    pygame.K_LEFT: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT
+}
+OPPOSITE = (Direction.DOWN, Direction.UP, Direction.RIGHT, Direction.LEFT)
 
 # Power-up types
 class PowerUpType(Enum):
@@ -78,45 +110,122 @@ class Obstacle:
     height: int
     color: Tuple[int, int, int]
     pattern: str
+    cached_surface: Optional[pygame.Surface] = None  # Rendered once, glow included
 
-class Particle:
-    def __init__(self, x, y, color, velocity, lifetime=60):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
+class ParticlePool:
+    """Particles stored as NumPy struct-of-arrays, updated in whole-array steps"""
+    # (color, size, alpha bin) -> pre-rendered circle, shared by all particles
+    _SPRITE_CACHE = {}
+    
+    def __init__(self, capacity=128):
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.max_life = np.ones(capacity, dtype=np.int16)
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.n = 0
+    
+    def __len__(self):
+        return self.n
+    
+    def add(self, x, y, color, velocities, lifetime=60):
+        """Spawn one particle per (vx, vy) in velocities at (x, y); color may be one per particle"""
+        velocities = np.asarray(velocities, dtype=np.float32).reshape(-1, 2)
+        count = len(velocities)
+        capacity = len(self.life)
+        if self.n + count > capacity:
+            # Grow every array by doubling
+            while capacity < self.n + count:
+                capacity *= 2
+            for name in ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'size', 'color'):
+                old = getattr(self, name)
+                grown = np.ones((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:self.n] = old[:self.n]
+                setattr(self, name, grown)
+        
+        live = slice(self.n, self.n + count)
+        self.x[live] = x
+        self.y[live] = y
+        self.vx[live] = velocities[:, 0]
+        self.vy[live] = velocities[:, 1]
+        self.life[live] = self.max_life[live] = lifetime
+        self.size[live] = np.random.randint(2, 6, count)
+        self.color[live] = color
+        self.n += count
     
     def update(self):
-        self.x += self.velocity[0]
-        self.y += self.velocity[1]
-        self.lifetime -= 1
-        self.velocity = (self.velocity[0] * 0.98, self.velocity[1] * 0.98)
+        """Move, age and damp every particle, then repack the on-screen survivors"""
+        n = self.n
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+        self.vx[:n] *= 0.98
+        self.vy[:n] *= 0.98
+        
+        # Velocities only decay, so a particle past the edge (radius at most 5) never comes back
+        x, y = self.x[:n], self.y[:n]
+        alive = ((self.life[:n] > 0) & (x > -5) & (x < WINDOW_WIDTH + 5) & 
+                 (y > -5) & (y < WINDOW_HEIGHT + 5))
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.size, self.color):
+                arr[:live] = arr[:n][alive]
+            self.n = live
+    
+    @staticmethod
+    def sprite(color, size, alpha_bin):
+        """Pre-rendered fading circle, built on first use"""
+        key = (color, size, alpha_bin)
+        s = ParticlePool._SPRITE_CACHE.get(key)
+        if s is None:
+            s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, alpha_bin * 17), (size, size), size)
+            s = ParticlePool._SPRITE_CACHE[key] = s.convert_alpha()
+        return s
     
     def draw(self, screen):
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color_with_alpha = (*self.color, alpha)
-        s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s, color_with_alpha, (self.size, self.size), self.size)
-        screen.blit(s, (self.x - self.size, self.y - self.size))
+        """Draw every particle in one batched blit; returns the rects touched"""
+        n = self.n
+        # Fade in 16 alpha steps so the sprite cache stays small
+        alpha_bins = ((255 * self.life[:n].astype(np.int32)) // self.max_life[:n]) >> 4
+        return screen.blits([(ParticlePool.sprite(tuple(color), size, alpha_bin), (x - size, y - size)) 
+                             for x, y, size, alpha_bin, color in zip(self.x[:n].tolist(), self.y[:n].tolist(), 
+                                                                     self.size[:n].tolist(), alpha_bins.tolist(), 
+                                                                     self.color[:n].tolist())])
 
 class SnakeGame:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Retro Snake - Raspberry Pi Edition")
+        # Only QUIT and KEYDOWN are handled; SDL drops the rest (mouse motion etc.)
+        # before they reach Python, so the per-frame event list is usually empty
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         self.font_small = pygame.font.Font(None, 24)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_large = pygame.font.Font(None, 48)
         self.font_title = pygame.font.Font(None, 72)
+        self.background_pattern = self.create_background_pattern()  # Before reset_game bakes obstacles in
+        # Semi-transparent pause overlay, in display format for the fast alpha blit
+        self.pause_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.pause_overlay.fill(BLACK)
+        self.pause_overlay.set_alpha(128)
+        self.snake_tiles = {invincible: self.create_snake_tiles(invincible) 
+                            for invincible in (False, True)}
+        self.title_surface, self.title_rect = self.create_title_surface()
+        # Food pulse flipbook: sin(0.3 * t) repeats about every 21 frames
+        self.food_frames = [self.create_food_sprite(int(128 + 127 * math.sin(i * 0.3))) 
+                            for i in range(21)]
+        self.power_up_frames = {}  # color -> 72 pre-rendered rotation steps
         
         self.reset_game()
         self.state = GameState.MENU
-        self.particles = []
+        self.particles = ParticlePool()
         self.screen_shake = 0
-        self.background_pattern = self.create_background_pattern()
         
     def create_background_pattern(self):
         """Create a retro grid background pattern"""
@@ -129,19 +238,74 @@ class SnakeGame:
         for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
             pygame.draw.line(pattern, (10, 10, 20), (0, y), (WINDOW_WIDTH, y), 1)
             
-        return pattern
+        return pattern.convert()  # Display format, so per-frame blits skip pixel conversion
+    
+    def create_title_surface(self):
+        """Pre-render the menu title with its four glow copies"""
+        title_text = render_text(self.font_title, "RETRO SNAKE", NEON_GREEN)
+        glow_text = render_text(self.font_title, "RETRO SNAKE", (0, 100, 0))
+        surface = pygame.Surface((title_text.get_width() + 4, title_text.get_height() + 4), 
+                                 pygame.SRCALPHA)
+        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
+            surface.blit(glow_text, (2 + offset[0], 2 + offset[1]))
+        surface.blit(title_text, (2, 2))
+        rect = surface.get_rect(center=(WINDOW_WIDTH // 2, 150))
+        return surface.convert_alpha(), rect
+    
+    def create_food_sprite(self, pulse):
+        """Pre-render the food at one pulse level, with its 3px glow"""
+        color = (255, pulse, pulse)
+        sprite = pygame.Surface((GRID_SIZE + 6, GRID_SIZE + 6))
+        # Glow and body share the color, as the glow's alpha is ignored on the display
+        sprite.fill(color)
+        pygame.draw.rect(sprite, WHITE, (3, 3, GRID_SIZE, GRID_SIZE), 2)
+        return sprite.convert()
+    
+    def create_power_up_frames(self, color):
+        """Pre-render every rotation step of a power-up square in one color"""
+        frames = []
+        center = GRID_SIZE // 2
+        for offsets in _ROTATION_OFFSETS:
+            frame = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+            points = [(center + ox, center + oy) for ox, oy in offsets]
+            pygame.draw.polygon(frame, color, points)
+            pygame.draw.polygon(frame, WHITE, points, 2)
+            frames.append(frame.convert_alpha())
+        return frames
+    
+    def create_snake_tiles(self, invincible):
+        """Pre-render the head (with its 2px glow) and every body gradient step"""
+        color = NEON_GREEN if not invincible else NEON_PURPLE
+        head = pygame.Surface((GRID_SIZE + 4, GRID_SIZE + 4))
+        # The glow is opaque, as pygame ignores alpha on the display surface
+        head.fill(color)
+        pygame.draw.rect(head, WHITE, (2, 2, GRID_SIZE, GRID_SIZE), 1)
+        tiles = [head.convert()]
+        
+        # Gradient from head to tail; bottoms out at intensity 50 from index 21
+        for i in range(1, 22):
+            intensity = max(50, 255 - i * 10)
+            color = (0, intensity, 0) if not invincible else (intensity, 0, intensity)
+            body = pygame.Surface((GRID_SIZE, GRID_SIZE))
+            body.fill(color)
+            pygame.draw.rect(body, WHITE, body.get_rect(), 1)
+            tiles.append(body.convert())
+        return tiles
     
     def reset_game(self):
         """Reset game to initial state"""
-        self.snake = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
+        self.snake = deque([(GRID_WIDTH // 2, GRID_HEIGHT // 2)])
+        # Cell -> number of segments on it (grow and invincibility can stack them)
+        self.snake_cells = Counter(self.snake)
         self.direction = Direction.RIGHT
-        self.food = self.spawn_food()
+        self.last_move = Direction.RIGHT
         self.score = 0
         self.high_score = self.load_high_score()
         self.speed = 8
         self.base_speed = 8
         self.power_ups = []
         self.obstacles = []
+        self.obstacle_grid = np.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=bool)
         self.active_effects = {}
         self.effect_timers = {}
         self.invincible = False
@@ -150,6 +314,7 @@ class SnakeGame:
         self.level = 1
         
         self.generate_obstacles()
+        self.food = self.spawn_food()  # After obstacles, which it must avoid
         
     def load_high_score(self):
         """Load high score from file"""
@@ -169,13 +334,7 @@ class SnakeGame:
     
     def spawn_food(self):
         """Spawn food at random location avoiding snake and obstacles"""
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            
-            # Check if position is free
-            if (x, y) not in self.snake and not self.is_obstacle_at(x, y):
-                return (x, y)
+        return random.choice(self.free_cells)
     
     def spawn_power_up(self):
         """Spawn a random power-up"""
@@ -193,15 +352,33 @@ class SnakeGame:
         
         power_type, color = random.choice(power_up_types)
         
+        if len(self.free_cells) < 2:  # Only the food's cell is left
+            return
         while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            
-            if (x, y) not in self.snake and (x, y) != self.food and not self.is_obstacle_at(x, y):
+            x, y = random.choice(self.free_cells)
+            if (x, y) != self.food:
                 power_up = PowerUp(x, y, power_type, 300, color, time.time())
                 self.power_ups.append(power_up)
                 break
     
+    def claim_cell(self, cell):
+        """Take a cell out of the free list: swap it with the last entry, then pop"""
+        i = self.free_index.pop(cell, None)
+        if i is None:
+            return
+        last = self.free_cells.pop()
+        if last != cell:
+            self.free_cells[i] = last
+            self.free_index[last] = i
+    
+    def release_cell(self, cell):
+        """Return a cell the snake has left to the free list"""
+        x, y = cell
+        if (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT and 
+            not self.obstacle_grid[x, y] and cell not in self.free_index):
+            self.free_index[cell] = len(self.free_cells)
+            self.free_cells.append(cell)
+    
     def generate_obstacles(self):
         """Generate obstacles based on current level"""
         self.obstacles.clear()
@@ -210,6 +387,40 @@ class SnakeGame:
         
         for _ in range(obstacle_count):
             self.create_random_obstacle()
+        
+        self.obstacle_grid[:] = False
+        for obstacle in self.obstacles:
+            self.obstacle_grid[obstacle.x:obstacle.x + obstacle.width, 
+                               obstacle.y:obstacle.y + obstacle.height] = True
+            obstacle.cached_surface = self.render_obstacle(obstacle)
+        self.static_background = self.create_static_background()
+        self.full_redraw = True  # The new obstacles need a full repaint
+        
+        # Cells free of snake and obstacles, sampled directly by the spawners;
+        # free_index maps each cell to its slot for O(1) removal
+        self.free_cells = [cell for cell in ALL_CELLS 
+                           if not self.obstacle_grid[cell] and cell not in self.snake_cells]
+        self.free_index = {cell: i for i, cell in enumerate(self.free_cells)}
+    
+    def create_static_background(self):
+        """Composite the grid and this level's obstacles, which only change on level up"""
+        background = self.background_pattern.copy()
+        background.blits([(obstacle.cached_surface, 
+                           (obstacle.x * GRID_SIZE - 1, obstacle.y * GRID_SIZE - 1)) 
+                          for obstacle in self.obstacles], doreturn=False)
+        return background.convert()
+    
+    def render_obstacle(self, obstacle):
+        """Pre-render an obstacle's cells, each with its 1px glow, into one surface"""
+        surface = pygame.Surface((obstacle.width * GRID_SIZE + 2, obstacle.height * GRID_SIZE + 2))
+        for ox in range(obstacle.width):
+            for oy in range(obstacle.height):
+                rect = pygame.Rect(ox * GRID_SIZE + 1, oy * GRID_SIZE + 1, GRID_SIZE, GRID_SIZE)
+                
+                # Glow effect (opaque: the display surface has no alpha)
+                pygame.draw.rect(surface, obstacle.color, rect.inflate(2, 2))
+                pygame.draw.rect(surface, WHITE, rect, 1)
+        return surface.convert()
     
     def create_random_obstacle(self):
         """Create a random obstacle pattern"""
@@ -263,39 +474,29 @@ class SnakeGame:
     
     def is_obstacle_at(self, x, y):
         """Check if there's an obstacle at given position"""
-        for obstacle in self.obstacles:
-            if (obstacle.x <= x < obstacle.x + obstacle.width and 
-                obstacle.y <= y < obstacle.y + obstacle.height):
-                return True
-        return False
+        return bool(self.obstacle_grid[x, y])
     
-    def handle_input(self):
-        """Handle keyboard input"""
-        keys = pygame.key.get_pressed()
-        
+    def handle_keydown(self, key):
+        """Handle a key press (Escape is handled by the main loop)"""
         if self.state == GameState.PLAYING:
-            if keys[pygame.K_UP] and self.direction != Direction.DOWN:
-                self.direction = Direction.UP
-            elif keys[pygame.K_DOWN] and self.direction != Direction.UP:
-                self.direction = Direction.DOWN
-            elif keys[pygame.K_LEFT] and self.direction != Direction.RIGHT:
-                self.direction = Direction.LEFT
-            elif keys[pygame.K_RIGHT] and self.direction != Direction.LEFT:
-                self.direction = Direction.RIGHT
-            elif keys[pygame.K_SPACE]:
+            direction = DIRECTION_KEYS.get(key)
+            # Checked against the last move, so two quick presses can't reverse the snake
+            if direction is not None and direction != OPPOSITE[self.last_move]:
+                self.direction = direction
+            elif key == pygame.K_SPACE:
                 self.state = GameState.PAUSED
         
         elif self.state == GameState.PAUSED:
-            if keys[pygame.K_SPACE]:
+            if key == pygame.K_SPACE:
                 self.state = GameState.PLAYING
         
         elif self.state == GameState.MENU:
-            if keys[pygame.K_SPACE]:
+            if key == pygame.K_SPACE:
                 self.reset_game()
                 self.state = GameState.PLAYING
         
         elif self.state == GameState.GAME_OVER:
-            if keys[pygame.K_SPACE]:
+            if key == pygame.K_SPACE:
                 self.state = GameState.MENU
     
     def update_game(self):
@@ -312,15 +513,20 @@ class SnakeGame:
         if random.randint(1, 200) == 1:
             self.spawn_power_up()
         
-        # Remove expired power-ups
+        # Remove expired power-ups, compacting the list in place
         current_time = time.time()
-        self.power_ups = [p for p in self.power_ups 
-                         if current_time - p.spawn_time < 10]
+        kept = 0
+        for power_up in self.power_ups:
+            if current_time - power_up.spawn_time < 10:
+                self.power_ups[kept] = power_up
+                kept += 1
+        del self.power_ups[kept:]
         
         # Move snake
         head_x, head_y = self.snake[0]
-        dx, dy = self.direction.value
+        dx, dy = _DIR_VEC[self.direction]
         new_head = (head_x + dx, head_y + dy)
+        self.last_move = self.direction
         
         # Check collisions
         if self.check_collision(new_head):
@@ -328,7 +534,10 @@ class SnakeGame:
                 self.game_over()
                 return
         
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self.snake_cells[new_head] += 1
+        if self.snake_cells[new_head] == 1:
+            self.claim_cell(new_head)
         
         # Check food collision
         if new_head == self.food:
@@ -345,14 +554,18 @@ class SnakeGame:
             if self.score // 100 > self.level - 1:
                 self.level_up()
         else:
-            self.snake.pop()
+            self.pop_tail()
         
-        # Check power-up collision
-        for power_up in self.power_ups[:]:
+        # Check power-up collision, keeping the ones not collected in one pass
+        kept = 0
+        for power_up in self.power_ups:
             if new_head == (power_up.x, power_up.y):
                 self.apply_power_up(power_up)
-                self.power_ups.remove(power_up)
                 self.create_power_up_particles((power_up.x, power_up.y), power_up.color)
+            else:
+                self.power_ups[kept] = power_up
+                kept += 1
+        del self.power_ups[kept:]
     
     def check_collision(self, pos):
         """Check if position collides with walls, snake, or obstacles"""
@@ -363,7 +576,7 @@ class SnakeGame:
             return True
         
         # Self collision
-        if pos in self.snake:
+        if pos in self.snake_cells:
             return True
         
         # Obstacle collision
@@ -372,6 +585,14 @@ class SnakeGame:
         
         return False
     
+    def pop_tail(self):
+        """Remove the last snake segment, keeping the cell counts in step"""
+        tail = self.snake.pop()
+        self.snake_cells[tail] -= 1
+        if not self.snake_cells[tail]:
+            del self.snake_cells[tail]
+            self.release_cell(tail)
+    
     def apply_power_up(self, power_up):
         """Apply power-up effect"""
         effect_duration = 300  # frames
@@ -389,11 +610,12 @@ class SnakeGame:
                 if self.snake:
                     tail = self.snake[-1]
                     self.snake.append(tail)
+                    self.snake_cells[tail] += 1
         
         elif power_up.type == PowerUpType.SHRINK:
             if len(self.snake) > 3:
                 for _ in range(min(2, len(self.snake) - 1)):
-                    self.snake.pop()
+                    self.pop_tail()
         
         elif power_up.type == PowerUpType.INVINCIBILITY:
             self.invincible = True
@@ -433,29 +655,23 @@ class SnakeGame:
         self.screen_shake = 10
         
         # Create celebration particles
-        for _ in range(20):
-            self.create_random_particle((WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+        self.create_random_particles((WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2), 20)
     
     def create_food_particles(self, pos):
         """Create particles when food is eaten"""
         x, y = pos[0] * GRID_SIZE + GRID_SIZE // 2, pos[1] * GRID_SIZE + GRID_SIZE // 2
-        for _ in range(8):
-            velocity = (random.uniform(-3, 3), random.uniform(-3, 3))
-            self.particles.append(Particle(x, y, NEON_GREEN, velocity))
+        self.particles.add(x, y, NEON_GREEN, np.random.uniform(-3, 3, (8, 2)))
     
     def create_power_up_particles(self, pos, color):
         """Create particles when power-up is collected"""
         x, y = pos[0] * GRID_SIZE + GRID_SIZE // 2, pos[1] * GRID_SIZE + GRID_SIZE // 2
-        for _ in range(12):
-            velocity = (random.uniform(-4, 4), random.uniform(-4, 4))
-            self.particles.append(Particle(x, y, color, velocity))
+        self.particles.add(x, y, color, np.random.uniform(-4, 4, (12, 2)))
     
-    def create_random_particle(self, pos):
-        """Create a random colored particle"""
-        colors = [NEON_GREEN, NEON_PINK, NEON_BLUE, NEON_YELLOW, NEON_ORANGE]
-        color = random.choice(colors)
-        velocity = (random.uniform(-5, 5), random.uniform(-5, 5))
-        self.particles.append(Particle(pos[0], pos[1], color, velocity))
+    def create_random_particles(self, pos, count=1):
+        """Create randomly colored particles"""
+        colors = np.array([NEON_GREEN, NEON_PINK, NEON_BLUE, NEON_YELLOW, NEON_ORANGE], dtype=np.uint8)
+        velocities = np.random.uniform(-5, 5, (count, 2))
+        self.particles.add(pos[0], pos[1], colors[np.random.randint(0, len(colors), count)], velocities)
     
     def game_over(self):
         """Handle game over"""
@@ -467,126 +683,85 @@ class SnakeGame:
         # Create explosion particles
         head = self.snake[0]
         x, y = head[0] * GRID_SIZE + GRID_SIZE // 2, head[1] * GRID_SIZE + GRID_SIZE // 2
-        for _ in range(30):
-            velocity = (random.uniform(-6, 6), random.uniform(-6, 6))
-            self.particles.append(Particle(x, y, RED, velocity, 120))
+        self.particles.add(x, y, RED, np.random.uniform(-6, 6, (30, 2)), 120)
     
     def draw_snake(self):
-        """Draw the snake with gradient effect"""
+        """Draw the snake with gradient effect; returns the rects touched"""
+        tiles = self.snake_tiles[self.invincible]
+        head_x, head_y = self.snake[0]
+        # Head with glowing border, then the body gradient in one batch
+        blit_list = [(tiles[0], (head_x * GRID_SIZE - 2, head_y * GRID_SIZE - 2))]
         for i, (x, y) in enumerate(self.snake):
-            rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            
-            if i == 0:  # Head
-                color = NEON_GREEN if not self.invincible else NEON_PURPLE
-                # Add glowing effect for head
-                glow_rect = rect.inflate(4, 4)
-                pygame.draw.rect(self.screen, (*color, 100), glow_rect)
-            else:  # Body
-                # Gradient from head to tail
-                intensity = max(50, 255 - i * 10)
-                color = (0, intensity, 0) if not self.invincible else (intensity, 0, intensity)
-            
-            pygame.draw.rect(self.screen, color, rect)
-            pygame.draw.rect(self.screen, WHITE, rect, 1)
+            if i:
+                blit_list.append((tiles[min(i, 21)], (x * GRID_SIZE, y * GRID_SIZE)))
+        return self.screen.blits(blit_list)
     
     def draw_food(self):
-        """Draw food with pulsing effect"""
+        """Draw food with pulsing effect; returns the rect touched"""
         x, y = self.food
-        rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
         
-        # Pulsing effect
-        pulse = int(128 + 127 * math.sin(self.game_time * 0.3))
-        color = (255, pulse, pulse)
-        
-        # Glow effect
-        glow_rect = rect.inflate(6, 6)
-        pygame.draw.rect(self.screen, (*color, 80), glow_rect)
-        pygame.draw.rect(self.screen, color, rect)
-        pygame.draw.rect(self.screen, WHITE, rect, 2)
+        # Pulsing effect, one flipbook frame per tick
+        sprite = self.food_frames[self.game_time % 21]
+        return [self.screen.blit(sprite, (x * GRID_SIZE - 3, y * GRID_SIZE - 3))]
     
     def draw_power_ups(self):
-        """Draw power-ups with special effects"""
+        """Draw power-ups with special effects; returns the rects they occupy"""
         current_time = time.time()
+        rects = []
         
         for power_up in self.power_ups:
             x, y = power_up.x * GRID_SIZE, power_up.y * GRID_SIZE
             rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
+            rects.append(rect)  # Blinked-out frames still need repainting
             
             # Blinking effect when about to expire
             time_left = 10 - (current_time - power_up.spawn_time)
             if time_left < 3 and int(current_time * 10) % 2:
                 continue
             
-            # Rotating effect
-            angle = self.game_time * 5
-            
-            # Draw rotating square
-            center = rect.center
-            points = []
-            for i in range(4):
-                px = center[0] + (GRID_SIZE // 3) * math.cos(math.radians(angle + i * 90))
-                py = center[1] + (GRID_SIZE // 3) * math.sin(math.radians(angle + i * 90))
-                points.append((px, py))
-            
-            pygame.draw.polygon(self.screen, power_up.color, points)
-            pygame.draw.polygon(self.screen, WHITE, points, 2)
-    
-    def draw_obstacles(self):
-        """Draw obstacles with neon effects"""
-        for obstacle in self.obstacles:
-            for ox in range(obstacle.width):
-                for oy in range(obstacle.height):
-                    x = (obstacle.x + ox) * GRID_SIZE
-                    y = (obstacle.y + oy) * GRID_SIZE
-                    rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
-                    
-                    # Glow effect
-                    glow_rect = rect.inflate(2, 2)
-                    pygame.draw.rect(self.screen, (*obstacle.color, 100), glow_rect)
-                    pygame.draw.rect(self.screen, obstacle.color, rect)
-                    pygame.draw.rect(self.screen, WHITE, rect, 1)
+            # Rotating square, 5 degrees per frame, from the color's flipbook
+            frames = self.power_up_frames.get(power_up.color)
+            if frames is None:
+                frames = self.power_up_frames[power_up.color] = self.create_power_up_frames(power_up.color)
+            self.screen.blit(frames[self.game_time % 72], rect)
+        
+        return rects
     
     def draw_hud(self):
-        """Draw heads-up display"""
+        """Draw heads-up display; returns the rects touched"""
+        rects = []
+        
         # Score
-        score_text = self.font_medium.render(f"Score: {self.score}", True, NEON_GREEN)
-        self.screen.blit(score_text, (10, 10))
+        score_text = render_text(self.font_medium, f"Score: {self.score}", NEON_GREEN)
+        rects.append(self.screen.blit(score_text, (10, 10)))
         
         # High Score
-        high_score_text = self.font_small.render(f"High: {self.high_score}", True, NEON_YELLOW)
-        self.screen.blit(high_score_text, (10, 45))
+        high_score_text = render_text(self.font_small, f"High: {self.high_score}", NEON_YELLOW)
+        rects.append(self.screen.blit(high_score_text, (10, 45)))
         
         # Level
-        level_text = self.font_small.render(f"Level: {self.level}", True, NEON_BLUE)
-        self.screen.blit(level_text, (10, 70))
+        level_text = render_text(self.font_small, f"Level: {self.level}", NEON_BLUE)
+        rects.append(self.screen.blit(level_text, (10, 70)))
         
         # Speed
-        speed_text = self.font_small.render(f"Speed: {self.speed}", True, NEON_CYAN)
-        self.screen.blit(speed_text, (10, 95))
+        speed_text = render_text(self.font_small, f"Speed: {self.speed}", NEON_CYAN)
+        rects.append(self.screen.blit(speed_text, (10, 95)))
         
         # Active effects
         y_offset = 120
         for effect, timer in self.effect_timers.items():
             effect_name = effect.replace('_', ' ').title()
             color = NEON_PURPLE if effect == 'invincibility' else NEON_ORANGE
-            effect_text = self.font_small.render(f"{effect_name}: {timer//60}s", True, color)
-            self.screen.blit(effect_text, (10, y_offset))
+            effect_text = render_text(self.font_small, f"{effect_name}: {timer//60}s", color)
+            rects.append(self.screen.blit(effect_text, (10, y_offset)))
             y_offset += 25
+        
+        return rects
     
     def draw_menu(self):
         """Draw main menu"""
-        # Title with glow effect
-        title_text = self.font_title.render("RETRO SNAKE", True, NEON_GREEN)
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
-        
-        # Glow effect
-        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            glow_text = self.font_title.render("RETRO SNAKE", True, (0, 100, 0))
-            glow_rect = title_rect.copy()
-            glow_rect.move_ip(offset)
-            self.screen.blit(glow_text, glow_rect)
-        
-        self.screen.blit(title_text, title_rect)
+        # Title with glow effect, pre-rendered
+        self.screen.blit(self.title_surface, self.title_rect)
         
         # Instructions
         instructions = [
@@ -609,67 +784,65 @@ class SnakeGame:
                     if int(time.time() * 3) % 2 == 0:
                         color = WHITE
                 
-                text = self.font_medium.render(instruction, True, color)
+                text = render_text(self.font_medium, instruction, color)
                 text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
                 self.screen.blit(text, text_rect)
             
             y_offset += 35
     
     def draw_game_over(self):
-        """Draw game over screen"""
+        """Draw game over screen; returns the rects touched"""
+        rects = []
+        
         # Game Over text
-        game_over_text = self.font_large.render("GAME OVER", True, RED)
+        game_over_text = render_text(self.font_large, "GAME OVER", RED)
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
-        self.screen.blit(game_over_text, game_over_rect)
+        rects.append(self.screen.blit(game_over_text, game_over_rect))
         
         # Final score
-        score_text = self.font_medium.render(f"Final Score: {self.score}", True, NEON_GREEN)
+        score_text = render_text(self.font_medium, f"Final Score: {self.score}", NEON_GREEN)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, 280))
-        self.screen.blit(score_text, score_rect)
+        rects.append(self.screen.blit(score_text, score_rect))
         
         # High score
         if self.score == self.high_score and self.score > 0:
-            new_high_text = self.font_medium.render("NEW HIGH SCORE!", True, NEON_YELLOW)
+            new_high_text = render_text(self.font_medium, "NEW HIGH SCORE!", NEON_YELLOW)
             new_high_rect = new_high_text.get_rect(center=(WINDOW_WIDTH // 2, 320))
-            self.screen.blit(new_high_text, new_high_rect)
+            rects.append(self.screen.blit(new_high_text, new_high_rect))
         
         # Continue instruction
-        continue_text = self.font_medium.render("Press SPACE to Continue", True, NEON_PINK)
+        continue_text = render_text(self.font_medium, "Press SPACE to Continue", NEON_PINK)
         continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, 400))
         
         # Blinking effect
         if int(time.time() * 3) % 2 == 0:
             self.screen.blit(continue_text, continue_rect)
+        
+        rects.append(continue_rect)  # Also repainted while blinked out
+        return rects
     
     def draw_pause_screen(self):
         """Draw pause screen overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.pause_overlay, (0, 0))
         
         # Pause text
-        pause_text = self.font_large.render("PAUSED", True, NEON_YELLOW)
+        pause_text = render_text(self.font_large, "PAUSED", NEON_YELLOW)
         pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
         self.screen.blit(pause_text, pause_rect)
         
         # Continue instruction
-        continue_text = self.font_medium.render("Press SPACE to Continue", True, NEON_CYAN)
+        continue_text = render_text(self.font_medium, "Press SPACE to Continue", NEON_CYAN)
         continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
         self.screen.blit(continue_text, continue_rect)
     
     def update_particles(self):
         """Update and remove expired particles"""
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
     
     def draw_particles(self):
-        """Draw all particles"""
-        for particle in self.particles:
-            particle.draw(self.screen)
+        """Draw all particles; returns the rects touched"""
+        return self.particles.draw(self.screen)
     
     def apply_screen_shake(self):
         """Apply screen shake effect"""
@@ -682,6 +855,8 @@ class SnakeGame:
     def run(self):
         """Main game loop"""
         running = True
+        last_state = None
+        prev_dirty = []  # Rects drawn last frame, repainted from the background to erase them
         
         while running:
             # Handle events
@@ -696,35 +871,46 @@ class SnakeGame:
                             self.state = GameState.MENU
                         else:
                             running = False
-            
-            # Handle continuous input
-            self.handle_input()
+                    else:
+                        self.handle_keydown(event.key)
             
             # Update game
             self.update_game()
             self.update_particles()
             
-            # Draw everything
-            self.screen.blit(self.background_pattern, (0, 0))
+            # Repaint the whole screen unless only sprites moved on an unchanged background:
+            # the menu and the pause overlay cover everything, and a shake scrolls it all
+            shaking = self.screen_shake > 0
+            full = (not USE_DIRTY_RECTS or self.full_redraw or shaking or 
+                    self.state in (GameState.MENU, GameState.PAUSED) or self.state != last_state)
+            self.full_redraw = shaking  # The frame after a shake must also be full, to undo the scroll
+            last_state = self.state
+            
+            # Draw everything; obstacles are part of the static background
+            if self.state == GameState.MENU:
+                self.screen.blit(self.background_pattern, (0, 0))
+            elif full:
+                self.screen.blit(self.static_background, (0, 0))
+            else:
+                self.screen.blits([(self.static_background, rect, rect) for rect in prev_dirty], 
+                                  doreturn=False)
+            dirty = []
             
             if self.state == GameState.PLAYING:
-                self.draw_obstacles()
-                self.draw_food()
-                self.draw_power_ups()
-                self.draw_snake()
-                self.draw_hud()
+                dirty += self.draw_food()
+                dirty += self.draw_power_ups()
+                dirty += self.draw_snake()
+                dirty += self.draw_hud()
                 
             elif self.state == GameState.MENU:
                 self.draw_menu()
                 
             elif self.state == GameState.GAME_OVER:
                 # Still show game elements in background
-                self.draw_obstacles()
-                self.draw_snake()
-                self.draw_game_over()
+                dirty += self.draw_snake()
+                dirty += self.draw_game_over()
                 
             elif self.state == GameState.PAUSED:
-                self.draw_obstacles()
                 self.draw_food()
                 self.draw_power_ups()
                 self.draw_snake()
@@ -732,13 +918,18 @@ class SnakeGame:
                 self.draw_pause_screen()
             
             # Always draw particles on top
-            self.draw_particles()
+            dirty += self.draw_particles()
             
             # Apply screen effects
             self.apply_screen_shake()
             
-            # Update display
-            pygame.display.flip()
+            # Update display; a large changed area is cheaper to present in one flip
+            changed = prev_dirty + dirty
+            if full or sum(r.width * r.height for r in changed) > WINDOW_WIDTH * WINDOW_HEIGHT // 2:
+                pygame.display.flip()
+            else:
+                pygame.display.update(changed)
+            prev_dirty = dirty
             self.clock.tick(self.speed if self.state == GameState.PLAYING else 60)
         
         pygame.quit()